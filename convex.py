@@ -0,0 +1,106 @@
+"""Projection onto closed convex sets, batched like geometry.py.
+
+Each set holds the parameters of one set, or of many along the leading axes,
+and project(points) returns the point of each set closest to the given
+point. min_norm() is the projection of the origin, the element of smallest
+norm that the Hilbert projection theorem is about.
+"""
+
+import numpy as np
+
+from geometry import dot, norms
+
+
+class ConvexSet:
+    def project(self, points):
+        raise NotImplementedError
+
+    def min_norm(self):
+        return self.project(np.zeros(3))
+
+
+class Box(ConvexSet):
+    """The points between the corners lo and hi, coordinate by coordinate."""
+
+    def __init__(self, lo, hi):
+        self.lo, self.hi = np.asarray(lo, float), np.asarray(hi, float)
+
+    def project(self, points):
+        return np.clip(points, self.lo, self.hi)
+
+
+class Disk(ConvexSet):
+    """The points within radius of center (a ball, off the xy-plane)."""
+
+    def __init__(self, center, radius):
+        self.center, self.radius = np.asarray(center, float), np.asarray(radius, float)
+
+    def project(self, points):
+        offset = np.asarray(points, float) - self.center
+        distance = norms(offset)
+        scale = np.minimum(1, self.radius / np.maximum(distance, 1e-300))
+        return self.center + scale[..., None] * offset
+
+
+class HalfPlane(ConvexSet):
+    """The points x with dot(normal, x) <= offset."""
+
+    def __init__(self, normal, offset):
+        self.normal, self.offset = np.asarray(normal, float), np.asarray(offset, float)
+
+    def project(self, points):
+        points = np.asarray(points, float)
+        excess = np.maximum(0, dot(self.normal, points) - self.offset)
+        scale = excess / dot(self.normal, self.normal)
+        return points - scale[..., None] * self.normal
+
+
+class Polygon(ConvexSet):
+    """A convex polygon in the xy-plane, from its vertices in order along the
+    last axis but one, either way round."""
+
+    def __init__(self, vertices):
+        self.vertices = np.asarray(vertices, float)
+        self.edges = np.roll(self.vertices, -1, axis=-2) - self.vertices
+        # +1 for counterclockwise polygons, -1 for clockwise ones
+        turns = self._cross(np.roll(self.edges, 1, axis=-2), self.edges)
+        self.orientation = np.sign(turns.sum(-1))
+
+    @staticmethod
+    def _cross(u, v):
+        return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+
+    def project(self, points):
+        points = np.asarray(points, float)[..., None, :]
+        relative = points - self.vertices
+        # nearest point of every edge
+        t = np.clip(dot(relative, self.edges) / dot(self.edges, self.edges), 0, 1)
+        nearest = self.vertices + t[..., None] * self.edges
+        best = norms(nearest - points).argmin(-1)
+        closest = np.take_along_axis(nearest, best[..., None, None], axis=-2)[..., 0, :]
+        side = self._cross(self.edges, relative) * self.orientation[..., None]
+        inside = (side >= 0).all(-1)
+        inside_points = np.broadcast_to(points[..., 0, :], closest.shape)
+        return np.where(inside[..., None], inside_points, closest)
+
+
+class Intersection(ConvexSet):
+    """The points in all of sets, projected onto by Dykstra's algorithm."""
+
+    def __init__(self, *sets, iterations=200, tolerance=1e-10):
+        self.sets = sets
+        self.iterations = iterations
+        self.tolerance = tolerance
+
+    def project(self, points):
+        x = np.asarray(points, float)
+        corrections = [np.zeros_like(x) for _ in self.sets]
+        for _ in range(self.iterations):
+            previous = x
+            for k, convex_set in enumerate(self.sets):
+                y = convex_set.project(x + corrections[k])
+                corrections[k] = x + corrections[k] - y
+                x = y
+            if np.abs(x - previous).max() <= self.tolerance:
+                break
+        return x
@@ -0,0 +1,692 @@
+"""Static analysis of the scenes in scenes.py, and the deck command line.
+
+Run `python deck.py --help` for the commands. This module only reads
+scenes.py as source; manim is imported by the commands that render, so
+listing and checking the deck start in milliseconds.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import math
+import operator
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCENES_FILE = Path(__file__).with_name("scenes.py")
+MEDIA_DIR = SCENES_FILE.with_name("media")
+VIDEO_DIR = MEDIA_DIR / "videos" / SCENES_FILE.stem
+DURATIONS_FILE = MEDIA_DIR / "deck_durations.json"
+MANIFEST_FILE = MEDIA_DIR / "deck_manifest.json"
+BENCH_FILE = MEDIA_DIR / "bench.json"
+BENCH_BASELINE_FILE = SCENES_FILE.with_name("bench_baseline.json")
+DECK_NAME = "Deck"
+SCENE_BASES = ("Scene", "DeckScene")
+TEX_CLASSES = ("Tex", "MathTex", "Title")
+# local modules that run or measure renders without changing what is drawn,
+# left out of the scene hashes
+TOOLING = ("deck", "preview", "profiling", "tracing")
+
+# manim's -q flags and the folder each one renders into
+QUALITIES = {
+    "l": "480p15",
+    "m": "720p30",
+    "h": "1080p60",
+    "p": "1440p60",
+    "k": "2160p60",
+}
+# and the name manim's config gives each of them
+QUALITY_NAMES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+# metrics of `bench` checked against the baseline, and the smallest change of
+# each that is not put down to noise
+BENCH_METRICS = {
+    "wall": 0.5,
+    "latex": 0.2,
+    "svg": 0.2,
+    "raster": 0.2,
+    "encode": 0.2,
+    "points_mb": 1,
+    "peak_rss_mb": 20,
+}
+
+# manim's run time of a play() or wait() that does not give one, and of the
+# animations whose class sets its own
+DEFAULT_RUN_TIME = 1
+RUN_TIMES = {"DrawBorderThenFill": 2}
+# Write and Unwrite take 2 s for mobjects of at least this many parts
+LONG_WRITE_PARTS = 15
+
+# TeX commands that draw nothing themselves
+_SILENT_COMMANDS = {
+    "begin", "end", "text", "textbf", "textit", "emph", "mathbb", "mathcal",
+    "mathrm", "mathbf", "left", "right", "quad", "qquad", "displaystyle",
+}  # fmt: skip
+
+_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.USub: operator.neg,
+}
+_FUNCTIONS = {"len": len, "range": range}
+
+# fragments per LaTeX run when prewarming; a failing batch is left to manim
+BATCH_SIZE = 32
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return None
+
+
+def parse(path=SCENES_FILE):
+    return ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+
+
+def scene_classes(tree):
+    """Return the module-level scene class definitions of tree in file order."""
+    return [
+        node
+        for node in tree.body
+        if isinstance(node, ast.ClassDef)
+        and any(isinstance(b, ast.Name) and b.id in SCENE_BASES for b in node.bases)
+    ]
+
+
+def _local_modules(path):
+    """Return the (source, tree) of path and of the modules next to it that
+    it imports, directly or not."""
+    sources = {}
+    stack = [Path(path)]
+    while stack:
+        module = stack.pop()
+        if module in sources:
+            continue
+        source = module.read_text(encoding="utf-8")
+        sources[module] = source, ast.parse(source)
+        for node in ast.walk(sources[module][1]):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                candidate = module.with_name(name.split(".")[0] + ".py")
+                if candidate.exists():
+                    stack.append(candidate)
+    return sources
+
+
+def scene_hashes(path=SCENES_FILE):
+    """Hash the source of every scene class together with everything the
+    scenes share: the rest of scenes.py (imports, the TeX template and the
+    Tex wrappers) and the local modules it imports."""
+    path = Path(path)
+    sources = _local_modules(path)
+    source, tree = sources.pop(path)
+    lines = source.splitlines(keepends=True)
+    scenes = scene_classes(tree)
+
+    def segment(node):
+        start = min(n.lineno for n in [node, *getattr(node, "decorator_list", [])])
+        return "".join(lines[start - 1 : node.end_lineno]).encode()
+
+    shared = hashlib.sha256()
+    for node in tree.body:
+        if node not in scenes:
+            shared.update(segment(node))
+    for module in sorted(sources):
+        if module.stem not in TOOLING:
+            shared.update(sources[module][0].encode())
+    return {
+        node.name: hashlib.sha256(shared.digest() + segment(node)).hexdigest()
+        for node in scenes
+    }
+
+
+def tex_calls(tree):
+    """Yield (class name, tex strings, keyword literals) for every Tex, MathTex
+    and Title call in tree whose strings are all literals."""
+    for node in ast.walk(tree):
+        if not (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in TEX_CLASSES
+        ):
+            continue
+        strings = [_literal(arg) for arg in node.args]
+        if not strings or not all(isinstance(s, str) for s in strings):
+            continue
+        kwargs = {kw.arg: _literal(kw.value) for kw in node.keywords if kw.arg}
+        yield node.func.id, strings, kwargs
+
+
+def problems(tree):
+    """Yield a description of everything that would keep a scene of tree from
+    being rendered by name."""
+    seen = set()
+    for node in scene_classes(tree):
+        if node.name in seen:
+            yield f"line {node.lineno}: {node.name} is defined twice"
+        seen.add(node.name)
+        methods = {n.name for n in node.body if isinstance(n, ast.FunctionDef)}
+        if "construct" not in methods:
+            yield f"line {node.lineno}: {node.name} has no construct()"
+
+
+def _evaluate(node, env):
+    """Evaluate the constant arithmetic of node, looking names up in env."""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name) and node.id in env:
+        return env[node.id]
+    if (
+        isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and f"{node.value.id}.{node.attr}" in env
+    ):
+        return env[f"{node.value.id}.{node.attr}"]
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+        return _OPERATORS[type(node.op)](
+            _evaluate(node.left, env), _evaluate(node.right, env)
+        )
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _OPERATORS:
+        return _OPERATORS[type(node.op)](_evaluate(node.operand, env))
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [_evaluate(element, env) for element in node.elts]
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _FUNCTIONS
+        and not node.keywords
+    ):
+        return _FUNCTIONS[node.func.id](*(_evaluate(a, env) for a in node.args))
+    raise ValueError(f"line {node.lineno}: cannot evaluate {ast.unparse(node)}")
+
+
+def _keyword(call, name):
+    return next((kw.value for kw in call.keywords if kw.arg == name), None)
+
+
+def _is_wait(node):
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "Wait"
+    )
+
+
+def _glyphs(tex):
+    """Estimate how many paths manim draws for the tex string: one per
+    character or command, but none for braces, scripts, math shifts, line
+    breaks and the commands in _SILENT_COMMANDS."""
+    tex = re.sub(r"\\(begin|end)\{\w+\*?\}", "", tex)
+    commands = re.findall(r"\\([a-zA-Z]+|.)", tex)
+    rest = re.sub(r"\\([a-zA-Z]+|.)|[\s{}$^_&]", "", tex)
+    drawn = [c for c in commands if c not in _SILENT_COMMANDS and c.isalpha()]
+    return len(rest) + len(drawn)
+
+
+def _parts(node, env):
+    """Estimate the number of parts of the mobject node builds or names, or
+    return None if it is not a literal Tex, MathTex, Title, BulletedList or a
+    VGroup of them."""
+    # methods such as next_to() and scale() return the mobject itself
+    while (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and isinstance(node.func.value, ast.Call)
+    ):
+        node = node.func.value
+    if isinstance(node, ast.Name):
+        return env.get(("parts", node.id))
+    if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)):
+        return None
+    name = node.func.id
+    if name in ("VGroup", "Group"):
+        parts = [_parts(arg, env) for arg in node.args]
+        return None if None in parts else sum(parts)
+    strings = [_literal(arg) for arg in node.args]
+    if not strings or not all(isinstance(s, str) for s in strings):
+        return None
+    if name in TEX_CLASSES:
+        # a Title is underlined
+        return sum(map(_glyphs, strings)) + (name == "Title")
+    if name == "BulletedList":
+        return sum(map(_glyphs, strings)) + len(strings)
+    return None
+
+
+def _animation_time(node, env):
+    if isinstance(node, ast.Call):
+        run_time = _keyword(node, "run_time")
+        if run_time is not None:
+            return _evaluate(run_time, env)
+        if _is_wait(node) and node.args:
+            return _evaluate(node.args[0], env)
+        if isinstance(node.func, ast.Name):
+            if node.func.id in ("Write", "Unwrite") and node.args:
+                parts = _parts(node.args[0], env)
+                if parts is not None and parts >= LONG_WRITE_PARTS:
+                    return 2
+            return RUN_TIMES.get(node.func.id, DEFAULT_RUN_TIME)
+    return DEFAULT_RUN_TIME
+
+
+def _updater(call, env):
+    """Return whether call is add_updater(f) with f an updater of a mobject
+    and dt (a time-based updater), or None if f cannot be read."""
+    if not call.args:
+        return None
+    f = call.args[0]
+    if isinstance(f, ast.Name):
+        f = env.get(("function", f.id))
+    if isinstance(f, (ast.Lambda, ast.FunctionDef)):
+        return len(f.args.args) >= 2
+    return None
+
+
+def _wait_kind(env):
+    return "play" if env.get("time-based updaters") else "wait"
+
+
+def _timeline(statements, env, events):
+    for stmt in statements:
+        if isinstance(stmt, ast.FunctionDef):
+            env[("function", stmt.name)] = stmt
+        elif isinstance(stmt, ast.For) and isinstance(stmt.target, ast.Name):
+            for value in _evaluate(stmt.iter, env):
+                env[stmt.target.id] = value
+                _timeline(stmt.body, env, events)
+        elif isinstance(stmt, ast.Assign) and isinstance(stmt.targets[0], ast.Name):
+            name = stmt.targets[0].id
+            try:
+                env[name] = _evaluate(stmt.value, env)
+            except ValueError:
+                env.pop(name, None)
+            env[("parts", name)] = _parts(stmt.value, env)
+        elif (
+            isinstance(stmt, ast.Expr)
+            and isinstance(stmt.value, ast.Call)
+            and isinstance(stmt.value.func, ast.Attribute)
+            and stmt.value.func.attr in ("add_updater", "remove_updater")
+            and _updater(stmt.value, env)
+        ):
+            # manim renders waits while a time-based updater is attached
+            step = 1 if stmt.value.func.attr == "add_updater" else -1
+            env["time-based updaters"] = env.get("time-based updaters", 0) + step
+        elif (
+            isinstance(stmt, ast.Expr)
+            and isinstance(stmt.value, ast.Call)
+            and isinstance(stmt.value.func, ast.Attribute)
+            and isinstance(stmt.value.func.value, ast.Name)
+            and stmt.value.func.value.id == "self"
+        ):
+            call, method = stmt.value, stmt.value.func.attr
+            if method == "wait":
+                duration = call.args[0] if call.args else _keyword(call, "duration")
+                seconds = (
+                    DEFAULT_RUN_TIME if duration is None else _evaluate(duration, env)
+                )
+                events.append((_wait_kind(env), seconds))
+            elif method in ("play", "clear_stage"):
+                run_time = _keyword(call, "run_time")
+                if run_time is not None:
+                    seconds = _evaluate(run_time, env)
+                else:
+                    times = [_animation_time(arg, env) for arg in call.args]
+                    seconds = max(times, default=DEFAULT_RUN_TIME)
+                held = len(call.args) == 1 and _is_wait(call.args[0])
+                events.append((_wait_kind(env) if held else "play", seconds))
+
+
+def scene_timeline(node):
+    """Return the (kind, seconds) of every play() and wait() that the scene
+    class node runs, in order; waits are held frames unless a time-based
+    updater is attached."""
+    construct = next(
+        n for n in node.body if isinstance(n, ast.FunctionDef) and n.name == "construct"
+    )
+    # class attributes are read in construct() as self.<name>
+    env = {}
+    for stmt in node.body:
+        if isinstance(stmt, ast.Assign) and isinstance(stmt.targets[0], ast.Name):
+            try:
+                env[f"self.{stmt.targets[0].id}"] = _evaluate(stmt.value, env)
+            except ValueError:
+                pass
+    events = []
+    _timeline(construct.body, env, events)
+    return events
+
+
+def list_scenes(args):
+    """Print the scenes in file order with their source hashes."""
+    hashes = scene_hashes()
+    if args.json:
+        print(json.dumps([{"name": n, "hash": h} for n, h in hashes.items()]))
+    else:
+        for name, digest in hashes.items():
+            print(f"{digest[:12]}  {name}")
+
+
+def check(args):
+    """Exit non-zero if scenes.py does not parse or a scene is malformed."""
+    try:
+        tree = parse()
+    except SyntaxError as e:
+        sys.exit(f"{SCENES_FILE.name}:{e.lineno}: {e.msg}")
+    found = list(problems(tree))
+    for problem in found:
+        print(f"{SCENES_FILE.name} {problem}")
+    if found:
+        sys.exit(1)
+    print(f"{len(scene_classes(tree))} scenes OK")
+
+
+def _compile_chunk(chunk):
+    import scenes
+    import tex_batch
+
+    return tex_batch.compile_batch(chunk, scenes.template)
+
+
+def prewarm(args):
+    """Compile every literal TeX fragment of the deck that is not cached yet."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    import scenes
+    import tex_batch
+
+    found = {}
+    for scene in scene_classes(parse()):
+        for tex_class, strings, kwargs in tex_calls(scene):
+            found.update(
+                dict.fromkeys(tex_batch.fragments(tex_class, strings, **kwargs))
+            )
+    todo = tex_batch.missing(list(found), scenes.template)
+    print(f"{len(found)} TeX fragments, {len(todo)} to compile")
+    if not todo:
+        return
+
+    jobs = max(1, args.jobs)
+    size = min(BATCH_SIZE, math.ceil(len(todo) / jobs))
+    chunks = [todo[i : i + size] for i in range(0, len(todo), size)]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        failed = sum(not ok for ok in pool.map(_compile_chunk, chunks))
+    if failed:
+        print(f"{failed} of {len(chunks)} batches failed, manim will compile them")
+
+
+def _load_json(path):
+    try:
+        return json.loads(Path(path).read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def _save_json(path, data):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(data, indent=2, sort_keys=True))
+
+
+def quality_dir(quality):
+    return VIDEO_DIR / QUALITIES[quality]
+
+
+def _render_scene(name, quality):
+    start = time.perf_counter()
+    # manim's cleanup after each fragment can delete the .dvi of a fragment
+    # that a parallel process is about to convert, in the shared media/Tex
+    command = [sys.executable, "-m", "manim", f"-q{quality}", "--no_latex_cleanup"]
+    result = subprocess.run(command + [SCENES_FILE.name, name], cwd=SCENES_FILE.parent)
+    return result.returncode, time.perf_counter() - start
+
+
+def stitch(names, quality):
+    """Concatenate the rendered movies of names, in order, into the deck movie."""
+    movies = [quality_dir(quality) / f"{name}.mp4" for name in names]
+    movies = [movie for movie in movies if movie.exists()]
+    concat_list = quality_dir(quality) / f"{DECK_NAME}.txt"
+    concat_list.write_text("".join(f"file '{movie.name}'\n" for movie in movies))
+    output = quality_dir(quality) / f"{DECK_NAME}.mp4"
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0"]
+        + ["-i", str(concat_list), "-c", "copy", str(output)],
+        check=True,
+    )
+    return output
+
+
+def render(args):
+    """Render the changed scenes on parallel manim processes, then stitch the
+    deck."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    hashes = scene_hashes()
+    deck = list(hashes)
+    manifest = _load_json(MANIFEST_FILE)
+    built = manifest.setdefault(args.quality, {})
+    names = [
+        name
+        for name in deck
+        if (not args.scenes or name in args.scenes)
+        and (
+            args.force
+            or built.get(name) != hashes[name]
+            or not (quality_dir(args.quality) / f"{name}.mp4").exists()
+        )
+    ]
+    print(f"{len(names)} scenes to render, {len(deck) - len(names)} skipped")
+    if names and args.prewarm:
+        prewarm(args)
+
+    durations = _load_json(DURATIONS_FILE)
+    recorded = durations.setdefault(args.quality, {})
+    # longest first; scenes that were never timed go first as they may be long
+    order = sorted(names, key=lambda name: -recorded.get(name, math.inf))
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = {pool.submit(_render_scene, n, args.quality): n for n in order}
+        for future in as_completed(futures):
+            name = futures[future]
+            code, seconds = future.result()
+            print(f"{name}: {'failed' if code else 'done'} in {seconds:.1f}s")
+            if code:
+                failed.append(name)
+            else:
+                recorded[name] = seconds
+                built[name] = hashes[name]
+    _save_json(DURATIONS_FILE, durations)
+    _save_json(MANIFEST_FILE, manifest)
+
+    if failed:
+        sys.exit(f"Not stitching, failed scenes: {', '.join(failed)}")
+    print(f"Wrote {stitch(deck, args.quality)}")
+
+
+def _profile_scene(name, quality, env=None):
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "profile.json"
+        subprocess.run(
+            [sys.executable, "profiling.py", name, quality, str(output)],
+            cwd=SCENES_FILE.parent,
+            env=env and {**os.environ, **env},
+            check=True,
+        )
+        return json.loads(output.read_text())
+
+
+def regressions(results, baseline, threshold):
+    """Yield (quality, scene, metric, old, new) for every metric that grew by
+    more than threshold (a fraction) over the baseline."""
+    for quality, scenes in results.items():
+        for name, metrics in scenes.items():
+            old_metrics = baseline.get(quality, {}).get(name, {})
+            for metric, noise in BENCH_METRICS.items():
+                old, new = old_metrics.get(metric), metrics[metric]
+                if old is not None and new - old > max(threshold * old, noise):
+                    yield quality, name, metric, old, new
+
+
+def bench(args):
+    """Profile every scene from a cold start at each quality, one at a time."""
+    names = [node.name for node in scene_classes(parse())]
+    names = [name for name in names if not args.scenes or name in args.scenes]
+    results = {}
+    for quality in args.quality or ["l", "h"]:
+        for name in names:
+            metrics = _profile_scene(name, quality)
+            results.setdefault(quality, {})[name] = metrics
+            print(
+                f"{QUALITIES[quality]} {name}: {metrics['wall']:.1f}s, "
+                f"{metrics['fps']:.1f} fps, latex {metrics['latex']:.1f}s, "
+                f"svg {metrics['svg']:.1f}s, raster {metrics['raster']:.1f}s, "
+                f"encode {metrics['encode']:.1f}s, {metrics['peak_rss_mb']:.0f} MB"
+            )
+            if args.compact:
+                compact = _profile_scene(name, quality, {"DECK_COMPACT_TEX": "1"})
+                metrics["compact"] = compact
+                print(
+                    f"  compact Tex: points {metrics['points_mb']:.1f} -> "
+                    f"{compact['points_mb']:.1f} MB, peak "
+                    f"{metrics['peak_rss_mb']:.0f} -> {compact['peak_rss_mb']:.0f} MB, "
+                    f"raster {metrics['raster']:.1f} -> {compact['raster']:.1f}s"
+                )
+    _save_json(args.output, results)
+
+    if args.save_baseline:
+        _save_json(args.baseline, results)
+        return
+    found = list(regressions(results, _load_json(args.baseline), args.threshold))
+    for quality, name, metric, old, new in found:
+        print(
+            f"REGRESSION {QUALITIES[quality]} {name} {metric}: {old:.2f} -> {new:.2f}"
+        )
+    if found:
+        sys.exit(1)
+
+
+def watch(args):
+    """Re-render the scenes edited in scenes.py and preview the latest one."""
+    import preview
+
+    preview.watch(args.scene, args.quality, args.port, args.interval)
+
+
+def _minutes(seconds):
+    return f"{int(seconds // 60)}:{seconds % 60:04.1f}"
+
+
+def timeline(args):
+    """Print every scene's runtime and frame counts without rendering."""
+    fps = args.fps or int(QUALITIES[args.quality].split("p")[1])
+    rows = []
+    for node in scene_classes(parse()):
+        try:
+            events = scene_timeline(node)
+        except ValueError as e:
+            print(f"{node.name}: {e}", file=sys.stderr)
+            continue
+        seconds = sum(t for _, t in events)
+        # animations render every frame, waits one held frame
+        rendered = sum(math.ceil(t * fps) for kind, t in events if kind == "play")
+        held = sum(int(t * fps) for kind, t in events if kind == "wait")
+        rows.append((node.name, seconds, rendered + held, rendered))
+
+    # seconds per rendered frame, from the scenes profiled by `bench`
+    benched = _load_json(BENCH_FILE).get(args.quality, {})
+    measured = [(benched[r[0]]["wall"], r[3]) for r in rows if r[0] in benched]
+    per_frame = sum(w for w, _ in measured) / max(1, sum(f for _, f in measured))
+
+    print(f"{'scene':<30}{'runtime':>10}{'frames':>9}{'rendered':>10}{'cost':>9}")
+    for name, seconds, frames, rendered in rows:
+        cost = f"{rendered * per_frame:.0f}s" if measured else "-"
+        print(f"{name:<30}{_minutes(seconds):>10}{frames:>9}{rendered:>10}{cost:>9}")
+    total = sum(r[1] for r in rows)
+    frames, rendered = sum(r[2] for r in rows), sum(r[3] for r in rows)
+    cost = f"{rendered * per_frame:.0f}s" if measured else "-"
+    print(f"{DECK_NAME:<30}{_minutes(total):>10}{frames:>9}{rendered:>10}{cost:>9}")
+
+    if args.slot and total > args.slot * 60:
+        sys.exit(f"The deck runs {_minutes(total)}, over the {args.slot} minute slot")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render tools for scenes.py.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("list", help="list the scenes and their hashes")
+    command.add_argument("--json", action="store_true")
+    command.set_defaults(func=list_scenes)
+
+    command = commands.add_parser("check", help="validate scenes.py statically")
+    command.set_defaults(func=check)
+
+    command = commands.add_parser("prewarm", help="compile the deck's TeX in parallel")
+    command.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    command.set_defaults(func=prewarm)
+
+    command = commands.add_parser("render", help="render and stitch the deck")
+    command.add_argument("scenes", nargs="*", help="only render these scenes")
+    command.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    command.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    command.add_argument("--no-prewarm", dest="prewarm", action="store_false")
+    command.add_argument("--force", action="store_true", help="ignore the manifest")
+    command.set_defaults(func=render)
+
+    command = commands.add_parser("bench", help="profile the scenes")
+    command.add_argument("scenes", nargs="*", help="only profile these scenes")
+    command.add_argument(
+        "-q", "--quality", choices=QUALITIES, action="append", help="default: l, h"
+    )
+    command.add_argument("-o", "--output", type=Path, default=BENCH_FILE)
+    command.add_argument("--baseline", type=Path, default=BENCH_BASELINE_FILE)
+    command.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed slowdown (fraction)"
+    )
+    command.add_argument(
+        "--save-baseline", action="store_true", help="store the results as baseline"
+    )
+    command.add_argument(
+        "--compact", action="store_true", help="also profile with DECK_COMPACT_TEX"
+    )
+    command.set_defaults(func=bench)
+
+    command = commands.add_parser("timeline", help="estimate runtimes statically")
+    command.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    command.add_argument("--fps", type=float, help="default: the quality's rate")
+    command.add_argument("--slot", type=float, help="fail above this many minutes")
+    command.set_defaults(func=timeline)
+
+    command = commands.add_parser("watch", help="re-render edited scenes live")
+    command.add_argument("scene", nargs="?", help="render this scene right away")
+    command.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    command.add_argument("--port", type=int, default=8000)
+    command.add_argument("--interval", type=float, default=0.2, help="seconds")
+    command.set_defaults(func=watch)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
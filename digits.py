@@ -0,0 +1,132 @@
+"""Decimal digits of constants, streamed on demand.
+
+A constant is given by its fixed-point function: fixed_point(n) returns the
+integer floor(x * 10**n), computed with Python's arbitrary-precision ints.
+digits() yields the digits of x as they are asked for, computing them in
+blocks of doubling precision, and files them in media/digits under the
+constant's name and a fingerprint of its function, so the next run starts
+from the cache.
+"""
+
+import hashlib
+import os
+import types
+from decimal import Decimal
+from math import isqrt
+
+import deck
+
+CACHE_DIR = deck.MEDIA_DIR / "digits"
+
+# digits computed past the ones handed out, to absorb truncation errors
+GUARD = 10
+BLOCK = 64
+
+
+def _arctan_inverse(x, one):
+    # arctan(1/x) * one by its Taylor series
+    total = term = one // x
+    k, x2 = 1, x * x
+    while term:
+        term //= -x2
+        total += term // (2 * k + 1)
+        k += 1
+    return total
+
+
+def pi_fixed_point(n):
+    # Machin's formula, pi = 16 arctan(1/5) - 4 arctan(1/239)
+    one = 10 ** (n + GUARD)
+    pi = 16 * _arctan_inverse(5, one) - 4 * _arctan_inverse(239, one)
+    return pi // 10**GUARD
+
+
+def e_fixed_point(n):
+    one = 10 ** (n + GUARD)
+    total, term, k = 0, one, 1
+    while term:
+        total += term
+        term //= k
+        k += 1
+    return total // 10**GUARD
+
+
+def sqrt_fixed_point(k):
+    return lambda n: isqrt(k * 10 ** (2 * n))
+
+
+CONSTANTS = {
+    "pi": pi_fixed_point,
+    "e": e_fixed_point,
+    "sqrt2": sqrt_fixed_point(2),
+}
+
+
+def register(name, fixed_point):
+    """Make a constant available to digits() by name."""
+    CONSTANTS[name] = fixed_point
+
+
+def _fingerprint(fixed_point):
+    # the function's code and the values it closes over, so that a constant
+    # registered again under the same name does not read the old digits
+    code = fixed_point.__code__
+    consts = [
+        c.co_code if isinstance(c, types.CodeType) else c for c in code.co_consts
+    ]
+    cells = [cell.cell_contents for cell in fixed_point.__closure__ or ()]
+    text = repr((code.co_code, consts, code.co_names, cells))
+    return hashlib.sha256(text.encode()).hexdigest()[:12]
+
+
+def _save(path, text):
+    # a whole new file swapped in, so that processes sharing the cache never
+    # see a partly written one
+    if path.exists() and path.stat().st_size >= len(text):
+        return
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp.write_text(text)
+    os.replace(temp, path)
+
+
+def _cached(path):
+    if path.exists():
+        with open(path) as f:
+            while block := f.read(4096):
+                yield block
+
+
+def digits(name):
+    """Yield the decimal digits of the named constant one at a time, those of
+    its integer part first."""
+    fixed_point = CONSTANTS[name]
+    path = CACHE_DIR / f"{name}-{_fingerprint(fixed_point)}.txt"
+    count = 0
+    for block in _cached(path):
+        yield from block
+        count += len(block)
+
+    # digits of the integer part, a single 0 for constants below 1
+    whole = len(str(fixed_point(0)))
+    # the next block doubles what the cache already holds
+    precision = max(BLOCK, 2 * count)
+    while True:
+        # Decimal prints ints of any length (str() refuses past 4300 digits);
+        # the zeros after the point of a constant below 1 are padded back
+        text = str(Decimal(fixed_point(precision + GUARD)))
+        text = text.zfill(whole + precision + GUARD)[:-GUARD]
+        if len(text) > count:
+            _save(path, text)
+            yield from text[count:]
+            count = len(text)
+        precision *= 2
+
+
+def decimal(name, num_digits):
+    """Return the first num_digits digits of the named constant as a decimal
+    string, such as "3.1415" for ("pi", 5)."""
+    stream = digits(name)
+    whole = len(str(CONSTANTS[name](0)))
+    head = "".join(next(stream) for _ in range(num_digits))
+    return head[:whole] + "." + head[whole:]
@@ -0,0 +1,77 @@
+"""Vector geometry on manim points, batched over the leading axes.
+
+Every function takes single points of shape (3,) or stacks of shape (N, 3)
+and broadcasts them against each other, so a whole field of vectors is one
+numpy call.
+"""
+
+import numpy as np
+
+
+def dot(u, v):
+    return np.einsum("...i,...i->...", np.asarray(u, float), np.asarray(v, float))
+
+
+def norms(v):
+    return np.sqrt(dot(v, v))
+
+
+def project(u, v):
+    """Return the projection of u onto the line spanned by v (zero for v = 0)."""
+    v = np.asarray(v, float)
+    uv, vv = np.broadcast_arrays(dot(u, v), dot(v, v))
+    scale = np.divide(uv, vv, out=np.zeros(uv.shape), where=vv != 0)
+    return scale[..., None] * v
+
+
+def reject(u, v):
+    """Return the component of u orthogonal to v."""
+    return np.asarray(u, float) - project(u, v)
+
+
+def angles(v):
+    """Return the angle of v in the xy-plane, counterclockwise from RIGHT."""
+    v = np.asarray(v, float)
+    return np.arctan2(v[..., 1], v[..., 0])
+
+
+def angles_between(u, v):
+    cos = dot(u, v) / (norms(u) * norms(v))
+    return np.arccos(np.clip(cos, -1, 1))
+
+
+def is_right_angle(u, v, rtol=1e-9):
+    """Return whether u and v are orthogonal, relative to their lengths."""
+    return np.abs(dot(u, v)) <= rtol * norms(u) * norms(v)
+
+
+class OrthogonalDecomposition:
+    """Splits points into their components in M, the span of basis, and in
+    its orthogonal complement.
+
+    An orthonormal basis of M is kept and only recomputed when set_basis() is
+    given a different basis, so splitting a batch of points costs two matrix
+    products."""
+
+    def __init__(self, basis):
+        self.basis = None
+        self.set_basis(basis)
+
+    def set_basis(self, basis):
+        basis = np.atleast_2d(np.asarray(basis, float))
+        if self.basis is not None and np.array_equal(basis, self.basis):
+            return
+        self.basis = basis
+        # the left singular vectors of nonzero singular values span M, whichever
+        # basis vectors depend on the others (unpivoted QR gets this wrong)
+        u, s, _ = np.linalg.svd(basis.T, full_matrices=False)
+        self.q = u[:, s > 1e-12 * max(1, s.max(initial=0))]
+
+    def project(self, points):
+        """Return P(x), the closest point of M, for every point x."""
+        return (np.asarray(points, float) @ self.q) @ self.q.T
+
+    def split(self, points):
+        """Return P(x) and Q(x) = x - P(x) for every point x."""
+        p = self.project(points)
+        return p, np.asarray(points, float) - p
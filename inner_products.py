@@ -0,0 +1,95 @@
+"""Inner products evaluated on batches of vectors, and a numerical check of
+the inner product axioms on random samples.
+
+An InnerProduct is called on two arrays of vectors along the last axis and
+returns <x, y> for every pair, broadcasting the leading axes like
+geometry.py. sample() draws random elements of its space.
+"""
+
+import numpy as np
+
+AXIOMS = ("symmetry", "bilinearity", "positive definiteness")
+
+
+class InnerProduct:
+    dim = None
+
+    def __call__(self, x, y):
+        raise NotImplementedError
+
+    def sample(self, rng, n):
+        # uniform draws are several times cheaper than normal ones
+        return rng.uniform(-1, 1, (n, self.dim))
+
+
+class Dot(InnerProduct):
+    """The dot product of R^dim."""
+
+    def __init__(self, dim):
+        self.dim = dim
+
+    def __call__(self, x, y):
+        return np.einsum("...i,...i->...", x, y)
+
+
+class WeightedDot(InnerProduct):
+    """sum w_i x_i y_i, an inner product when every weight is positive."""
+
+    def __init__(self, weights):
+        self.weights = np.asarray(weights, float)
+        self.dim = len(self.weights)
+
+    def __call__(self, x, y):
+        return np.einsum("...i,...i,i->...", x, y, self.weights)
+
+
+class L2(InnerProduct):
+    """The integral of f g over [a, b]. Functions are represented by their
+    values at the nodes of an n-point Gauss-Legendre rule, which integrates
+    the products of the polynomials sample() draws exactly."""
+
+    def __init__(self, a, b, n=8):
+        t, weights = np.polynomial.legendre.leggauss(n)
+        self.nodes = (b - a) / 2 * t + (a + b) / 2
+        self.weights = (b - a) / 2 * weights
+        self.dim = n
+        # values at the nodes of the Legendre polynomials of degree < n
+        self._legendre = np.polynomial.legendre.legvander(t, n - 1)
+
+    def values(self, f):
+        """Return the element for the vectorized function f."""
+        return f(self.nodes)
+
+    def __call__(self, x, y):
+        return np.einsum("...i,...i,i->...", x, y, self.weights)
+
+    def sample(self, rng, n):
+        # random polynomials of degree < dim / 2, whose products have degree
+        # < dim and so are integrated exactly
+        coefficients = rng.uniform(-1, 1, (n, self.dim // 2))
+        return coefficients @ self._legendre[:, : self.dim // 2].T
+
+
+def _close(a, b, scale, tolerance=1e-9):
+    return np.abs(a - b) <= tolerance * (1 + scale)
+
+
+def check_axioms(inner_product, n, rng):
+    """Draw n random triples x, y, z and scalars c and return how many of them
+    satisfy each axiom of AXIOMS, with every inner product they need taken in
+    one batched call."""
+    x, y, z = (inner_product.sample(rng, n) for _ in range(3))
+    c = rng.uniform(-1, 1, (n, 1))
+    left = np.stack([x, y, x, x, x, x])
+    right = np.stack([y, x, y + c * z, y, z, x])
+    xy, yx, x_ycz, x_y, x_z, xx = inner_product(left, right)
+
+    linear = x_y + c[:, 0] * x_z
+    return np.array(
+        [
+            _close(xy, yx, np.abs(xy)).sum(),
+            _close(x_ycz, linear, np.abs(x_y) + np.abs(c[:, 0] * x_z)).sum(),
+            # random vectors are never zero, so <x, x> must be positive
+            (xx > 0).sum(),
+        ]
+    )
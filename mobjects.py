@@ -0,0 +1,196 @@
+"""Mobjects shared by the scenes of the presentation."""
+
+import os
+
+import numpy as np
+from manim import BLUE_D, OUT, WHITE, VGroup, VMobject, config
+
+# control points of a straight cubic bezier from 0 to 1
+_LINE = np.array([0, 1 / 3, 2 / 3, 1])
+
+
+def line_points(starts, ends):
+    """Return the bezier points of the straight lines starts[i] -> ends[i] as
+    consecutive subpaths of one VMobject."""
+    starts, ends = np.asarray(starts, float), np.asarray(ends, float)
+    points = starts[:, None] + (ends - starts)[:, None] * _LINE[None, :, None]
+    return points.reshape(-1, 3)
+
+
+def dash_points(vertices, num_dashes=15, positive_space_ratio=0.5, closed=True):
+    """Return the bezier points of the dashes along the polygon through
+    vertices, about num_dashes of them, handed out to the edges by length."""
+    starts = np.asarray(vertices, float)
+    if closed:
+        ends = np.roll(starts, -1, axis=0)
+    else:
+        starts, ends = starts[:-1], starts[1:]
+    edges = ends - starts
+    lengths = np.linalg.norm(edges, axis=1)
+    counts = np.maximum(1, np.round(num_dashes * lengths / lengths.sum()).astype(int))
+
+    edge = np.repeat(np.arange(len(starts)), counts)
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    t0 = (k / counts[edge])[:, None]
+    t1 = ((k + positive_space_ratio) / counts[edge])[:, None]
+    return line_points(starts[edge] + t0 * edges[edge], starts[edge] + t1 * edges[edge])
+
+
+class LineBundle(VMobject):
+    """Straight lines, each one a four-point subpath of a single VMobject.
+
+    Partial animations such as Create draw every line from its start at
+    once, as they would separate lines, instead of one line after another
+    along the joined path."""
+
+    def pointwise_become_partial(self, vmobject, a, b):
+        lines = vmobject.points.reshape(-1, 4, 3)
+        starts, ends = lines[:, 0], lines[:, 3]
+        # the control points of a straight line are evenly spaced, so its
+        # partial is the line between the points at a and b
+        edges = ends - starts
+        self.set_points(line_points(starts + a * edges, starts + b * edges))
+        return self
+
+
+def _grid(lo, hi, step):
+    # multiples of step in [lo, hi], the axis itself excluded
+    ticks = np.arange(np.ceil(lo / step), np.floor(hi / step) + 1) * step
+    return ticks[ticks != 0]
+
+
+class GridPlane(VGroup):
+    """A NumberPlane made of two LineBundles, every background line being a
+    subpath of the first and both axes of the second, so that the grid is
+    built in one numpy pass and drawn with two strokes."""
+
+    def __init__(
+        self,
+        x_range=None,
+        y_range=None,
+        background_line_style=None,
+        axis_config=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        x_min, x_max, x_step = x_range or (
+            -config.frame_x_radius,
+            config.frame_x_radius,
+            1,
+        )
+        y_min, y_max, y_step = y_range or (
+            -config.frame_y_radius,
+            config.frame_y_radius,
+            1,
+        )
+        self.x_range = (x_min, x_max, x_step)
+        self.y_range = (y_min, y_max, y_step)
+
+        xs = _grid(x_min, x_max, x_step)
+        ys = _grid(y_min, y_max, y_step)
+        zx, zy = np.zeros_like(xs), np.zeros_like(ys)
+        starts = np.concatenate([np.c_[xs, zx + y_min, zx], np.c_[zy + x_min, ys, zy]])
+        ends = np.concatenate([np.c_[xs, zx + y_max, zx], np.c_[zy + x_max, ys, zy]])
+        self.background_lines = LineBundle()
+        self.background_lines.set_points(line_points(starts, ends))
+        self.background_lines.set_stroke(
+            **{
+                "color": BLUE_D,
+                "width": 2,
+                "opacity": 1,
+                **(background_line_style or {}),
+            }
+        )
+
+        self.axes = LineBundle()
+        self.axes.set_points(
+            line_points([[x_min, 0, 0], [0, y_min, 0]], [[x_max, 0, 0], [0, y_max, 0]])
+        )
+        self.axes.set_stroke(**{"color": WHITE, "width": 2, **(axis_config or {})})
+        self.add(self.background_lines, self.axes)
+
+    def get_origin(self):
+        return self.coords_to_point(0, 0)
+
+    def coords_to_point(self, x=0, y=0, z=0):
+        # read the frame off the axes, so it follows the plane when it moves
+        x_min, x_max, _ = self.x_range
+        y_min, y_max, _ = self.y_range
+        points = self.axes.points
+        x_unit = (points[3] - points[0]) / (x_max - x_min)
+        y_unit = (points[7] - points[4]) / (y_max - y_min)
+        origin = points[0] - x_min * x_unit
+        return origin + x * x_unit + y * y_unit + z * OUT
+
+    def point_to_coords(self, point):
+        origin = self.get_origin()
+        x_unit = self.coords_to_point(1, 0) - origin
+        y_unit = self.coords_to_point(0, 1) - origin
+        basis = np.array([x_unit[:2], y_unit[:2]]).T
+        return tuple(np.linalg.solve(basis, (np.asarray(point) - origin)[:2]))
+
+    c2p = coords_to_point
+    p2c = point_to_coords
+
+
+class DashedPolygon(VMobject):
+    """A dashed polygon whose dashes are the subpaths of a single VMobject."""
+
+    def __init__(
+        self, *vertices, num_dashes=15, positive_space_ratio=0.5, closed=True, **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.set_points(dash_points(vertices, num_dashes, positive_space_ratio, closed))
+        # the dashes enclose nothing
+        self.set_fill(opacity=0)
+
+
+class DashedRectangle(DashedPolygon):
+    def __init__(self, height=2, width=4, **kwargs):
+        w, h = width / 2, height / 2
+        super().__init__([-w, -h, 0], [-w, h, 0], [w, h, 0], [w, -h, 0], **kwargs)
+
+
+def compact_tex():
+    # DECK_COMPACT_TEX=1 stores the points of the scenes' Tex in float32
+    return bool(os.environ.get("DECK_COMPACT_TEX"))
+
+
+def compact_points(mobject, dtype=np.float32):
+    """Move the points of mobject's family into one contiguous array of dtype,
+    each submobject's points becoming a view into it.
+
+    Shifts and scalings keep the dtype; operations that assign new points
+    (rotations, transforms) give a submobject an array of its own again."""
+    family = mobject.family_members_with_points()
+    if not family:
+        return mobject
+    buffer = np.concatenate([m.points for m in family]).astype(dtype)
+    start = 0
+    for m in family:
+        end = start + len(m.points)
+        m.points = buffer[start:end]
+        start = end
+    return mobject
+
+
+# Tex built so far in this process, by class name, strings, options and
+# template. It lives here because the watch worker reloads scenes.py.
+tex_cache = {}
+
+
+def cache_tex():
+    # only processes rendering several scenes (manim -a, the watch worker,
+    # which sets DECK_TEX_CACHE) build the same Tex often enough to keep it
+    return config.write_all or bool(os.environ.get("DECK_TEX_CACHE"))
+
+_planes = {}
+
+
+def cached_plane(x_range=None, y_range=None):
+    """Return a copy of the GridPlane for this configuration, building it the
+    first time it is asked for."""
+    key = (x_range and tuple(x_range), y_range and tuple(y_range))
+    if key not in _planes:
+        _planes[key] = GridPlane(x_range, y_range)
+    return _planes[key].copy()
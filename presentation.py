@@ -0,0 +1,104 @@
+"""Base scene shared by every scene of the presentation."""
+
+import hashlib
+import os
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+
+from manim import ORIGIN, Camera, FadeOut, ImageMobject, Scene, config, tempconfig
+from manim.animation.animation import prepare_animation
+from manim.constants import RendererType
+
+import tex_batch
+from rendering import DeckFileWriter, DeckRenderer
+
+
+def _play_name(animations):
+    names = (type(a).__name__.lstrip("_") for a in animations)
+    return ", ".join(dict.fromkeys(names))
+
+
+class DeckScene(Scene):
+    # compile all literal TeX of construct() in one LaTeX run before it starts
+    batch_tex = True
+    trace = None
+
+    def __init__(self, renderer=None, **kwargs):
+        # config.renderer is a plain Enum, never equal to the string "cairo"
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = DeckRenderer(
+                file_writer_class=DeckFileWriter,
+                camera_class=kwargs.get("camera_class", Camera),
+                skip_animations=kwargs.get("skip_animations", False),
+            )
+        super().__init__(renderer=renderer, **kwargs)
+
+    def render(self, preview=False):
+        # a cached animation would leave a gap in a streamed movie; scenes
+        # that do not stream after all (sections, another renderer) keep the
+        # cache
+        file_writer = getattr(self.renderer, "file_writer", None)
+        streams = isinstance(file_writer, DeckFileWriter) and file_writer.streams()
+        caching = tempconfig({"disable_caching": True}) if streams else nullcontext()
+        with caching:
+            return self._render(preview)
+
+    def _render(self, preview):
+        # DECK_TRACE=<dir> writes <dir>/<scene>.trace.json
+        trace_dir = os.environ.get("DECK_TRACE")
+        if not trace_dir:
+            return super().render(preview)
+        # profiling needs the Unix-only resource module
+        from profiling import Profiler
+        from tracing import Trace
+
+        self.trace = Trace()
+        try:
+            with Profiler(self.trace), self.trace.span(type(self).__name__, "scene"):
+                return super().render(preview)
+        finally:
+            self.trace.save(Path(trace_dir) / f"{type(self).__name__}.trace.json")
+
+    def play(self, *args, **kwargs):
+        if self.trace is None:
+            return super().play(*args, **kwargs)
+        # .animate builders become the animations they stand for, built once
+        args = [prepare_animation(arg) for arg in args]
+        with self.trace.span(_play_name(args), "play", line=self._scene_line()):
+            return super().play(*args, **kwargs)
+
+    def _scene_line(self):
+        # the innermost caller in the file that defines the scene
+        filename = type(self).construct.__code__.co_filename
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_code.co_filename != filename:
+            frame = frame.f_back
+        if frame is None:
+            return None
+        return f"{Path(filename).name}:{frame.f_lineno}"
+
+    def setup(self):
+        super().setup()
+        if self.batch_tex:
+            tex_batch.compile_scene(type(self))
+
+    def clear_stage(self, *animations, run_time=1):
+        """Fade out everything on screen, played alongside animations (such as
+        FadeIn(title) to cross-fade into the next content).
+
+        The screen is captured once and faded as a single image, so every frame
+        of the transition is one composite however many mobjects were shown."""
+        # the static image of the last play already shows the mobjects on
+        # screen, which would be drawn over it a second time
+        self.renderer.static_image = None
+        self.renderer.update_frame(self, ignore_skipping=True)
+        frame = self.renderer.get_frame()
+        snapshot = ImageMobject(frame, scale_to_resolution=config.pixel_height)
+        snapshot.move_to(ORIGIN)
+        # manim hashes large arrays by an abbreviated repr of their top-left
+        # corner, so two snapshots would share a cached animation without this
+        snapshot.frame_digest = hashlib.blake2b(frame, digest_size=16).hexdigest()
+        self.clear()
+        self.add(snapshot)
+        self.play(FadeOut(snapshot), *animations, run_time=run_time)
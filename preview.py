@@ -0,0 +1,213 @@
+"""`python deck.py watch`: re-render the scene being edited and preview it.
+
+The watcher polls scenes.py and the local modules it imports. When a save
+changes some scenes' hashes, only those scenes are rendered again, by a
+worker process that has manim, scenes.py and manim's caches loaded already.
+The latest clip is served on a page that reloads it when a new one is ready.
+"""
+
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import deck
+
+PAGE = b"""<!doctype html>
+<title>Deck preview</title>
+<style>
+  body { background: #111; color: #ddd; font: 14px sans-serif; margin: 0 }
+  video { display: block; width: 100vw; max-height: 90vh; background: #000 }
+  pre { color: #f66; white-space: pre-wrap; padding: 0 1em }
+  p { padding: 0 1em }
+</style>
+<video id="clip" controls autoplay></video>
+<p id="status">Waiting for an edit to scenes.py</p>
+<pre id="error"></pre>
+<script>
+  let version = 0, clip = 0;
+  async function poll() {
+    const state = await (await fetch("/state")).json();
+    if (state.version !== version) {
+      version = state.version;
+      document.getElementById("status").textContent = state.status;
+      document.getElementById("error").textContent = state.error || "";
+    }
+    if (state.clip_version !== clip) {
+      clip = state.clip_version;
+      document.getElementById("clip").src = "/clip?v=" + clip;
+    }
+  }
+  setInterval(() => poll().catch(() => {}), 300);
+</script>
+"""
+
+
+def _worker(jobs, results, quality):
+    # runs until the parent sends None; everything imported here stays warm
+    import importlib
+
+    from manim import tempconfig
+
+    import scenes
+
+    os.environ["DECK_TEX_CACHE"] = "1"
+    options = {"quality": deck.QUALITY_NAMES[quality], "media_dir": str(deck.MEDIA_DIR)}
+    while True:
+        name = jobs.get()
+        if name is None:
+            return
+        start = time.perf_counter()
+        try:
+            scenes = importlib.reload(scenes)
+            with tempconfig(options):
+                scene = getattr(scenes, name)()
+                scene.render()
+                clip = str(scene.renderer.file_writer.movie_file_path)
+            results.put((name, clip, time.perf_counter() - start, None))
+        except Exception:
+            results.put(
+                (name, None, time.perf_counter() - start, traceback.format_exc())
+            )
+
+
+class Worker:
+    """A render process that is restarted when the modules it has imported
+    change underneath it."""
+
+    def __init__(self, quality):
+        self.quality = quality
+        self.context = multiprocessing.get_context("spawn")
+        self.process = None
+
+    def start(self):
+        # fresh queues every time: a process terminated while writing to a
+        # queue can leave it corrupt
+        self.jobs = self.context.Queue()
+        self.results = self.context.Queue()
+        self.process = self.context.Process(
+            target=_worker, args=(self.jobs, self.results, self.quality), daemon=True
+        )
+        self.process.start()
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+    def stop(self):
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join()
+            self.process = None
+
+    def submit(self, name):
+        if self.process is None or not self.process.is_alive():
+            self.start()
+        self.jobs.put(name)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    state = None
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/":
+            self._send(PAGE, "text/html")
+        elif path == "/state":
+            self._send(json.dumps(self.state).encode(), "application/json")
+        elif path == "/clip" and self.state["clip"]:
+            with open(self.state["clip"], "rb") as f:
+                self._send(f.read(), "video/mp4")
+        else:
+            self.send_error(404)
+
+    def _send(self, body, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _stamps(modules):
+    return {path: path.stat().st_mtime_ns for path in modules if path.exists()}
+
+
+def watch(scene=None, quality="l", port=8000, interval=0.2):
+    state = {
+        "version": 0,
+        "status": "",
+        "error": None,
+        "clip": None,
+        "clip_version": 0,
+    }
+    _Handler.state = state
+    server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Previewing on http://127.0.0.1:{port}/")
+
+    worker = Worker(quality)
+    worker.start()
+    hashes = deck.scene_hashes()
+    modules = list(deck._local_modules(deck.SCENES_FILE))
+    stamps = _stamps(modules)
+    current = scene
+    if current:
+        worker.submit(current)
+
+    def publish(status, clip=None, error=None):
+        state.update(status=status, error=error, version=state["version"] + 1)
+        if clip:
+            state.update(clip=clip, clip_version=state["clip_version"] + 1)
+        print(status if error is None else f"{status}\n{error}")
+
+    try:
+        while True:
+            try:
+                name, clip, seconds, error = worker.results.get(timeout=interval)
+            except queue.Empty:
+                pass
+            else:
+                if error is None:
+                    publish(f"{name} rendered in {seconds:.1f}s", clip)
+                else:
+                    publish(f"{name} failed after {seconds:.1f}s", error=error)
+
+            new_stamps = _stamps(modules)
+            if new_stamps == stamps:
+                continue
+            changed_files = {p for p in new_stamps if new_stamps[p] != stamps.get(p)}
+            stamps = new_stamps
+            try:
+                new_hashes = deck.scene_hashes()
+                modules = list(deck._local_modules(deck.SCENES_FILE))
+            except SyntaxError as e:
+                publish("scenes.py does not parse", error=str(e))
+                continue
+
+            changed = [n for n in new_hashes if hashes.get(n) != new_hashes[n]]
+            hashes = new_hashes
+            if changed_files - {deck.SCENES_FILE}:
+                # the worker holds the old versions of the modules scenes.py
+                # imports, so it is started afresh
+                worker.restart()
+            if len(changed) > 1:
+                # shared code changed: stay on the scene being worked on
+                changed = [current] if current in changed else changed[:1]
+            for name in changed:
+                publish(f"Rendering {name}")
+                worker.submit(name)
+                current = name
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.stop()
+        server.shutdown()
@@ -0,0 +1,149 @@
+"""Per-stage timing of a scene render, used by `python deck.py bench`.
+
+`python profiling.py <scene> <quality> <output.json>` renders one scene of
+scenes.py from a cold, empty media directory and writes its metrics.
+"""
+
+import functools
+import json
+import resource
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+from manim import MathTex, SVGMobject, config, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils import tex_file_writing
+
+import deck
+import mobjects
+import rendering
+import tex_batch
+
+# the functions whose time is booked to each stage
+STAGES = {
+    "mobject": [(MathTex, "__init__"), (mobjects.GridPlane, "__init__")],
+    "latex": [
+        (tex_file_writing, "compile_tex"),
+        (tex_file_writing, "convert_to_svg"),
+        (tex_batch, "compile_batch"),
+    ],
+    "svg": [(SVGMobject, "__init__")],
+    "raster": [(CairoRenderer, "update_frame")],
+    "encode": [
+        (SceneFileWriter, "write_frame"),
+        (SceneFileWriter, "close_movie_pipe"),
+        (SceneFileWriter, "combine_to_movie"),
+        (rendering.DeckFileWriter, "write_frame"),
+        (rendering.DeckFileWriter, "close_movie_pipe"),
+        (rendering.DeckFileWriter, "combine_to_movie"),
+        (rendering.DeckFileWriter, "write_held_frame"),
+    ],
+}
+
+
+class Profiler:
+    """Patches the functions of STAGES while active and adds up the time spent
+    in each stage, counting nested calls of a stage once. With a trace, every
+    call is also recorded as a span."""
+
+    def __init__(self, trace=None):
+        self.trace = trace
+        self.seconds = defaultdict(float)
+        self._active = set()
+        self._patched = []
+
+    def _timed(self, stage, function):
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            if self.trace is not None:
+                with self.trace.span(function.__qualname__, stage):
+                    return counted(*args, **kwargs)
+            return counted(*args, **kwargs)
+
+        def counted(*args, **kwargs):
+            if stage in self._active:
+                return function(*args, **kwargs)
+            self._active.add(stage)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.seconds[stage] += time.perf_counter() - start
+                self._active.discard(stage)
+
+        return timed
+
+    def __enter__(self):
+        for stage, targets in STAGES.items():
+            for owner, name in targets:
+                original = getattr(owner, name)
+                self._patched.append((owner, name, original))
+                setattr(owner, name, self._timed(stage, original))
+        return self
+
+    def __exit__(self, *exc_info):
+        while self._patched:
+            owner, name, original = self._patched.pop()
+            setattr(owner, name, original)
+
+
+def _peak_rss_mb(who):
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(who).ru_maxrss / 1024
+
+
+def _points_mb(scene):
+    arrays = {}
+    for mobject in scene.mobjects:
+        for member in mobject.get_family():
+            # views of one buffer count once
+            points = member.points
+            base = points if points.base is None else points.base
+            arrays[id(base)] = base.nbytes
+    return sum(arrays.values()) / 2**20
+
+
+def profile(scene_name, quality):
+    import scenes
+
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig(
+        {
+            "quality": deck.QUALITY_NAMES[quality],
+            "media_dir": media_dir,
+            "disable_caching": True,
+        }
+    ):
+        with Profiler() as profiler:
+            start = time.perf_counter()
+            scene = getattr(scenes, scene_name)()
+            # the points on stage, sampled as each animation starts
+            points_mb = [0]
+            play = scene.play
+
+            def sampled_play(*args, **kwargs):
+                points_mb.append(_points_mb(scene))
+                return play(*args, **kwargs)
+
+            scene.play = sampled_play
+            scene.render()
+            wall = time.perf_counter() - start
+        frames = round(scene.renderer.time * config.frame_rate)
+
+    return {
+        "wall": wall,
+        "frames": frames,
+        "fps": frames / wall,
+        **{stage: profiler.seconds[stage] for stage in STAGES},
+        "points_mb": max(points_mb),
+        "peak_rss_mb": _peak_rss_mb(resource.RUSAGE_SELF),
+        "peak_child_rss_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN),
+    }
+
+
+if __name__ == "__main__":
+    scene_name, quality, output = sys.argv[1:]
+    with open(output, "w") as f:
+        json.dump(profile(scene_name, quality), f)
@@ -0,0 +1,275 @@
+"""Renderer and file writer used by DeckScene."""
+
+import hashlib
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+from manim import config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from segments import SegmentFile
+
+
+def _fps():
+    fps = config.frame_rate
+    return int(fps) if fps == int(fps) else fps
+
+
+def streaming():
+    # DECK_STREAM=1 encodes each scene's frames straight into its movie
+    return bool(os.environ.get("DECK_STREAM"))
+
+
+def segmented():
+    # DECK_SEGMENTS=1 appends a scene's partial movies to one segment file
+    return bool(os.environ.get("DECK_SEGMENTS"))
+
+
+def _piped_encoder():
+    # manim 0.18.0 encodes through an ffmpeg subprocess, which the methods
+    # below extend; later releases encode with PyAV instead
+    return hasattr(SceneFileWriter, "open_movie_pipe")
+
+
+def _ffmpeg():
+    return getattr(config, "ffmpeg_executable", "ffmpeg")
+
+
+def _link(source, target):
+    if os.path.exists(target):
+        os.remove(target)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+class DeckFileWriter(SceneFileWriter):
+    """Opens the encoder of an animation on its first frame, so that a held
+    frame can be encoded by a process of its own.
+
+    When streaming, there are no partial movies: a single encoder, started on
+    the scene's first frame, writes the scene's movie and frames are written
+    to it straight from the camera's pixel array.
+
+    With segments, the partial movies are appended to one SegmentFile per
+    scene rather than written as files of their own."""
+
+    _pending = None
+    _held = False
+    _stream = None
+    _segment_file = None
+
+    def _mp4_movie(self):
+        return (
+            _piped_encoder()
+            and config.write_to_movie
+            and not config.transparent
+            and config.movie_file_extension == ".mp4"
+        )
+
+    def streams(self):
+        # sections are cut from the partial movies, so they need those
+        return (
+            streaming()
+            and self._mp4_movie()
+            and not getattr(config, "save_sections", False)
+        )
+
+    def segments(self):
+        return (
+            segmented()
+            and self._mp4_movie()
+            and not self.streams()
+            and not getattr(config, "save_sections", False)
+        )
+
+    @property
+    def segment_file(self):
+        if self._segment_file is None:
+            directory = Path(self.partial_movie_directory)
+            self._segment_file = SegmentFile(directory / f"{directory.name}.segments")
+        return self._segment_file
+
+    def holds_supported(self):
+        return self._mp4_movie() and not self.streams()
+
+    def is_already_cached(self, hash_invocation):
+        if self.segments():
+            return hash_invocation in self.segment_file
+        return super().is_already_cached(hash_invocation)
+
+    def open_movie_pipe(self, file_path=None):
+        if not self.segments():
+            return super().open_movie_pipe(file_path)
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self._segment_key = Path(file_path).stem
+        command = self.encoder_command("-", options=["-f", "mpegts"])
+        self.writing_process = self.segment_file.start(command, stdin=subprocess.PIPE)
+
+    def close_movie_pipe(self):
+        if not self.segments():
+            return super().close_movie_pipe()
+        self.writing_process.stdin.close()
+        self.segment_file.finish(self._segment_key, self.writing_process)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if self.streams():
+            return
+        self._pending = (allow_write, file_path)
+
+    def _begin_pending(self):
+        if self._pending is not None:
+            super().begin_animation(*self._pending)
+            self._pending = None
+
+    def write_frame(self, frame_or_renderer, *args, **kwargs):
+        if self.streams():
+            return self._stream_frame(frame_or_renderer)
+        self._begin_pending()
+        super().write_frame(frame_or_renderer, *args, **kwargs)
+
+    def _stream_frame(self, frame):
+        if self._stream is None:
+            command = self.encoder_command(self.movie_file_path)
+            logger.debug(f"Streaming frames to {self.movie_file_path}")
+            self._stream = subprocess.Popen(command, stdin=subprocess.PIPE)
+        # the pipe reads the array's buffer, no bytes copy is made
+        self._stream.stdin.write(frame)
+
+    def end_animation(self, allow_write=False):
+        if self.streams():
+            return
+        if self._held:
+            self._held = False
+            return
+        self._begin_pending()
+        super().end_animation(allow_write)
+
+    def encoder_command(self, output, filters=(), options=()):
+        command = [
+            _ffmpeg(),
+            "-y",
+            "-f",
+            "rawvideo",
+            "-s",
+            f"{config.pixel_width}x{config.pixel_height}",
+            "-pix_fmt",
+            "rgba",
+            "-r",
+            str(_fps()),
+            "-i",
+            "-",
+            "-an",
+            "-loglevel",
+            config.ffmpeg_loglevel.lower(),
+            "-nostats",
+        ]
+        if filters:
+            command += ["-vf", ",".join(filters)]
+        command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p", *options]
+        return command + [str(output)]
+
+    def write_held_frame(self, frame, num_frames):
+        """Write frame num_frames times, sending it to the encoder only once."""
+        allow_write, file_path = self._pending or (False, None)
+        if not (allow_write and self.holds_supported()):
+            for _ in range(num_frames):
+                self.write_frame(frame)
+            return
+        self._pending = None
+        self._held = True
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+
+        # holds are cached by what is on screen and how long it stays there,
+        # so retiming a wait never touches the segments around it, and going
+        # back to an earlier timing is a cache hit
+        digest = hashlib.blake2b(frame.tobytes(), digest_size=16).hexdigest()
+        hold = Path(self.partial_movie_directory) / f"hold_{digest}_{num_frames}.mp4"
+        segments = self.segments()
+        if segments:
+            cached = hold.stem in self.segment_file
+        else:
+            cached = hold.exists()
+        if config.disable_caching or not cached:
+            target = file_path if config.disable_caching else hold
+            # ffmpeg clones the single input frame; x264 turns the repeats into
+            # skip blocks, so the cost no longer grows with the length of the hold
+            filters = [f"tpad=stop_mode=clone:stop={num_frames - 1}"]
+            options = ["-tune", "stillimage"]
+            logger.debug(f"Holding frame for {num_frames} frames in {target}")
+            if segments:
+                command = self.encoder_command("-", filters, [*options, "-f", "mpegts"])
+                self.segment_file.write(Path(target).stem, command, frame.tobytes())
+            else:
+                command = self.encoder_command(target, filters, options)
+                subprocess.run(command, input=frame.tobytes(), check=True)
+        if config.disable_caching:
+            return
+        if segments:
+            self.segment_file.alias(Path(file_path).stem, hold.stem)
+        else:
+            _link(hold, file_path)
+
+    def combine_to_movie(self):
+        if not (self.streams() or self.segments()):
+            return super().combine_to_movie()
+        if self.includes_sound:
+            logger.warning("Sounds are left out of streamed and segmented movies")
+        if self.streams():
+            return
+        keys = [Path(p).stem for p in self.partial_movie_files if p is not None]
+        self.segment_file.concat(
+            keys,
+            self.movie_file_path,
+            _ffmpeg(),
+            config.ffmpeg_loglevel.lower(),
+        )
+        self.segment_file.save()
+        logger.info(
+            f"Movie muxed from {len(keys)} segments of {self.segment_file.path}"
+        )
+
+    def clean_cache(self):
+        if not self.segments():
+            return super().clean_cache()
+        # past the cache limit, keep only the segments of this render
+        if len(self.segment_file) > config.max_files_cached:
+            keys = [Path(p).stem for p in self.partial_movie_files if p is not None]
+            self.segment_file.compact(keys)
+
+    def finish(self):
+        if self._stream is not None:
+            self._stream.stdin.close()
+            if self._stream.wait() != 0:
+                raise subprocess.CalledProcessError(self._stream.returncode, "ffmpeg")
+            self._stream = None
+        super().finish()
+
+
+class DeckRenderer(CairoRenderer):
+    def render(self, scene, time, moving_mobjects):
+        if not self.file_writer.streams():
+            return super().render(scene, time, moving_mobjects)
+        # the camera paints into the same pixel array every frame and the
+        # frame is in the encoder's pipe before the next one is drawn, so it
+        # is passed on without get_frame()'s copy
+        self.update_frame(scene, moving_mobjects)
+        self.add_frame(self.camera.pixel_array)
+
+    def freeze_current_frame(self, duration):
+        dt = 1 / self.camera.frame_rate
+        num_frames = int(duration / dt)
+        if (
+            self.skip_animations
+            or num_frames < 2
+            or not self.file_writer.holds_supported()
+        ):
+            return super().freeze_current_frame(duration)
+        self.time += num_frames * dt
+        self.file_writer.write_held_frame(self.get_frame(), num_frames)
@@ -1,6 +1,21 @@
 from manim import *
 import numpy as np
 
+import convex
+import geometry
+import inner_products
+from mobjects import (
+    DashedRectangle,
+    cache_tex,
+    cached_plane,
+    compact_points,
+    compact_tex,
+    tex_cache,
+)
+from digits import decimal
+from presentation import DeckScene
+from sequences import Sequence, inner_product_sums, norm_squared_sums, sample_indices
+
 template = TexTemplate()
 template.add_to_preamble(
     r"""
@@ -14,27 +29,76 @@ template.add_to_preamble(
 )
 
 
-class Tex(Tex):
-    def __init__(self, *args, **kwargs):
-        super().__init__(tex_template=template, *args, **kwargs)
-
-
-class MathTex(MathTex):
-    def __init__(self, *args, **kwargs):
-        super().__init__(tex_template=template, *args, **kwargs)
-
+class CachedTex:
+    """Builds each distinct Tex with the template above. In processes that
+    render several scenes, later instances start as copies of the first
+    one."""
 
-class Title(Title):
     def __init__(self, *args, **kwargs):
-        super().__init__(tex_template=template, *args, **kwargs)
-
-
-class IntroScene(Scene):
+        # by name, since reloading this module makes new classes
+        key = (
+            type(self).__qualname__,
+            args,
+            repr(sorted(kwargs.items())),
+            template.body,
+        )
+        if key in tex_cache:
+            self.__dict__.update(tex_cache[key].copy().__dict__)
+        else:
+            super().__init__(tex_template=template, *args, **kwargs)
+        # copies own their points, so they are compacted again
+        if compact_tex():
+            compact_points(self)
+        if key not in tex_cache and cache_tex():
+            tex_cache[key] = self.copy()
+
+
+class Tex(CachedTex, Tex):
+    pass
+
+
+class MathTex(CachedTex, MathTex):
+    pass
+
+
+class Title(CachedTex, Title):
+    pass
+
+
+class ProgressiveTex(Tex):
+    """Tex compiled once whose glyphs are shown a prefix at a time. Hidden
+    glyphs are collapsed onto the centre of the shown ones, so they take no
+    room and grow out of it when revealed."""
+
+    def __init__(self, *args, shown=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.glyphs = self.family_members_with_points()
+        start = self.glyphs[0].points[0]
+        self.layout = [glyph.points - start for glyph in self.glyphs]
+        self.layout_width = self.glyphs[0].width
+        self.reveal(len(self.glyphs) if shown is None else shown)
+
+    def reveal(self, n):
+        """Show the first n glyphs, centred where the shown ones were."""
+        center = self.get_center()
+        first = self.glyphs[0]
+        start, scale = first.points[0], first.width / self.layout_width
+        for glyph, points in zip(self.glyphs[:n], self.layout[:n]):
+            glyph.set_points(start + scale * points)
+        shift = center - VGroup(*self.glyphs[:n]).get_center()
+        for glyph in self.glyphs[:n]:
+            glyph.shift(shift)
+        for glyph in self.glyphs[n:]:
+            glyph.set_points(np.repeat([center], len(glyph.points), axis=0))
+        return self
+
+
+class IntroScene(DeckScene):
     def construct(self):
         title = Tex("Hilbert Spaces", font_size=100)
 
         # shamelessly stolen (https://www.youtube.com/watch?v=ABy-pimA4wU)
-        plane = NumberPlane()
+        plane = cached_plane()
 
         vecu = [-1, 3, 0]
         vecv = [3, 4, 0]
@@ -43,10 +107,7 @@ class IntroScene(Scene):
         arrowV = Arrow(ORIGIN, vecv, buff=0, color=BLUE)
 
         # Compute Projection of U onto V
-        numerator = np.dot(vecu, vecv)
-        demoninator = np.linalg.norm(vecv) ** 2
-        scalar = numerator / demoninator
-        vecProjUtoV = scalar * np.array(vecv)
+        vecProjUtoV = geometry.project(vecu, vecv)
         ArrowProjection = Arrow(ORIGIN, vecProjUtoV, buff=0, color=PINK)
 
         # Compute Line orthogonal to V
@@ -66,18 +127,18 @@ class IntroScene(Scene):
         self.play(Transform(arrowU1, ArrowProjection))
         self.play(FadeOut(line), FadeOut(Rangle))
         self.wait(10)
-        self.play(*[FadeOut(mob) for mob in self.mobjects], FadeIn(title))
+        self.clear_stage(FadeIn(title))
         self.wait(3)
 
 
-class InnerProductIntroScene(Scene):
+class InnerProductIntroScene(DeckScene):
     def construct(self):
         title = Tex("What are Hilbert spaces?")
         hl = Tex("1. Inner product").next_to(title, DOWN)
         group = VGroup(title, hl).move_to((0, 0, 0))
 
         # dot product
-        plane = NumberPlane()
+        plane = cached_plane()
         vecu = [-1, 3, 0]
         vecv = [6, 2, 0]
         arrow_u = Arrow(ORIGIN, vecu, buff=0, color=YELLOW)
@@ -122,10 +183,10 @@ class InnerProductIntroScene(Scene):
         self.wait(3)
         self.play(Write(text))
         self.wait(3)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
 
-class InnerProductScene(Scene):
+class InnerProductScene(DeckScene):
     def construct(self):
         title = Tex("What is an inner product?", font_size=75)
         self.play(Write(title))
@@ -158,7 +219,69 @@ class InnerProductScene(Scene):
         self.play(FadeOut(group))
 
 
-class InnerProductAdditionalScene(Scene):
+class InnerProductAxiomsScene(DeckScene):
+    def construct(self):
+        title = Title("Checking the axioms on random vectors").to_edge(UP)
+
+        products = [
+            inner_products.Dot(3),
+            inner_products.WeightedDot([1, 2, 3]),
+            inner_products.L2(0, 1),
+            inner_products.WeightedDot([1, -1, 1]),
+        ]
+        names = [
+            MathTex(r"x \cdot y", font_size=35),
+            MathTex(r"x_1 y_1 + 2 x_2 y_2 + 3 x_3 y_3", font_size=35),
+            MathTex(r"\int_0^1 f(t) g(t) \, dt", font_size=35),
+            MathTex(r"x_1 y_1 - x_2 y_2 + x_3 y_3", font_size=35),
+        ]
+        header = [
+            Tex("Symmetry", font_size=35),
+            Tex("Bilinearity", font_size=35),
+            Tex("Positive definiteness", font_size=35),
+        ]
+        # percentage of the samples so far satisfying each axiom
+        rates = [
+            [
+                DecimalNumber(100, num_decimal_places=1, unit=r"\%", font_size=35)
+                for _ in header
+            ]
+            for _ in products
+        ]
+        cells = [VMobject(), *header]
+        for name, row in zip(names, rates):
+            cells += [name, *row]
+        grid = VGroup(*cells).arrange_in_grid(rows=len(products) + 1, buff=(0.5, 0.4))
+        samples = Integer(0, font_size=35).to_edge(DOWN)
+        samples_label = Tex("samples per inner product", font_size=35)
+        samples_label.add_updater(lambda m: m.next_to(samples, RIGHT))
+
+        rng = np.random.default_rng(442)
+        passed = np.zeros((len(products), len(header)))
+        per_frame = 10_000
+
+        def run_checks(m, dt):
+            if dt == 0:
+                return
+            for i, inner_product in enumerate(products):
+                passed[i] += inner_products.check_axioms(inner_product, per_frame, rng)
+            samples.set_value(samples.get_value() + per_frame)
+            for row, counts in zip(rates, passed):
+                for rate, count in zip(row, counts):
+                    rate.set_value(100 * count / samples.get_value())
+                    rate.set_color(WHITE if count == samples.get_value() else RED)
+
+        self.play(Write(title))
+        self.play(Write(grid), Write(samples), Write(samples_label))
+        self.wait()
+        grid.add_updater(run_checks)
+        self.wait(10)
+        grid.remove_updater(run_checks)
+        self.wait(3)
+        self.clear_stage()
+
+
+class InnerProductAdditionalScene(DeckScene):
     def construct(self):
         l1 = Tex(
             r"A vector space $V$ with an inner product $\langle \cdot, \cdot \rangle$\\ is called an \textbf{inner product space}.",
@@ -194,7 +317,7 @@ class InnerProductAdditionalScene(Scene):
         self.play(FadeOut(VGroup(l1, l2, l3, dp, dp1)))
 
         # dot product
-        plane = NumberPlane()
+        plane = cached_plane()
         vecu = [-1, 2, 0]
         vecv = [-4, -2, 0]
         arrow_u = Arrow(ORIGIN, vecu, buff=0, color=YELLOW)
@@ -235,10 +358,10 @@ class InnerProductAdditionalScene(Scene):
         self.wait(3)
         self.play(Write(text))
         self.wait(8)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
 
-class OrthogonalityScene(Scene):
+class OrthogonalityScene(DeckScene):
     def construct(self):
         title = Tex("What are Hilbert spaces?")
         hl = Tex("2. Orthogonality").next_to(title, DOWN)
@@ -275,10 +398,10 @@ class OrthogonalityScene(Scene):
         self.wait(10)
         self.play(Write(l4))
         self.wait(2)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
         # orthogonal animation
-        plane = NumberPlane()
+        plane = cached_plane()
         vecu = [-1, 2, 0]
         vecp1 = np.array([-4, -2, 0])
         vecp2 = np.array([-4, -2, 0]) * -0.5
@@ -307,7 +430,7 @@ class OrthogonalityScene(Scene):
             ReplacementTransform(arrow_p2, line_2),
         )
         self.wait()
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
         l1 = Title("Orthogonal complements are closed subspaces.", color=BLUE)
         l2 = Tex(
@@ -348,10 +471,15 @@ class OrthogonalityScene(Scene):
         self.play(Write(l6))
         self.play(Write(l7))
         self.wait(30)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
+
 
+class CompletenessScene(DeckScene):
+    # the constant approached by its decimal truncations, a Cauchy sequence in Q
+    constant = "pi"
+    symbol = r"\pi"
+    num_digits = 11
 
-class CompletenessScene(Scene):
     def construct(self):
         title = Tex("What are Hilbert spaces?")
         hl = Tex("3. Completeness").next_to(title, DOWN)
@@ -375,8 +503,8 @@ class CompletenessScene(Scene):
             r"$\Q$ is a \textbf{not} a complete vector space.", font_size=35
         ).next_to(l3, DOWN)
 
-        pi = "3.1415926535"
-        curr = Tex(pi[:3], font_size=35).next_to(l4, DOWN)
+        expansion = decimal(self.constant, self.num_digits)
+        curr = ProgressiveTex(expansion, shown=3, font_size=35).next_to(l4, DOWN)
 
         sg1 = VGroup(l1, l2, l3, l4, curr).move_to(ORIGIN)
 
@@ -391,22 +519,20 @@ class CompletenessScene(Scene):
         self.wait()
 
         self.play(Write(curr))
-        for i in range(4, len(pi)):
-            ncurr = Tex(pi[:i], font_size=35).move_to(curr)
-            self.play(ReplacementTransform(curr, ncurr, run_time=0.5))
-            curr = ncurr
+        for i in range(4, self.num_digits + 1):
+            self.play(curr.animate.reveal(i), run_time=0.5)
 
-        fin = Tex(r"$\pi$", font_size=35).move_to(curr)
+        fin = Tex(f"${self.symbol}$", font_size=35).move_to(curr)
         self.play(ReplacementTransform(curr, fin))
         self.wait()
 
-        fin2 = Tex(r"$\pi \not\in \Q$", font_size=35).move_to(fin)
+        fin2 = Tex(rf"${self.symbol} \not\in \Q$", font_size=35).move_to(fin)
         self.play(ReplacementTransform(fin, fin2))
         self.wait(2)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
 
-class HilbertSpaceDefinitionScene(Scene):
+class HilbertSpaceDefinitionScene(DeckScene):
     def construct(self):
         title = Title("What is a Hilbert space?", color=BLUE).to_edge(UP)
 
@@ -436,7 +562,7 @@ class HilbertSpaceDefinitionScene(Scene):
         self.wait(7)
         self.play(Write(ex2))
         self.wait(3)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
         title2 = Title("What is $\ell^2$?").to_edge(UP)
 
@@ -465,50 +591,89 @@ class HilbertSpaceDefinitionScene(Scene):
         self.wait(3)
         self.play(Write(l5))
         self.wait(3)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
 
-class Theorem1Intro(Scene):
+class SquareSummableScene(DeckScene):
     def construct(self):
-        class DashedRectangle(VGroup):
-            def __init__(
-                self,
-                height=4,
-                width=5,
-                positive_space_ratio=0.5,
-                num_dashes=30,
-                *args,
-                **kwargs
-            ):
-                VGroup.__init__(self, *args, **kwargs)
-                h1 = [ORIGIN, UP * height]
-                w1 = [UP * height, UP * height + RIGHT * width]
-                h2 = [UP * height + RIGHT * width, RIGHT * width]
-                w2 = [RIGHT * width, ORIGIN]
-                alpha = width / height
-                divs = num_dashes
-
-                n_h = int(divs / (2 * (alpha + 1)))
-                n_w = int(alpha * n_h)
-                dashedrectangle = VGroup()
-                for n, l in zip([n_w, n_h], [[w1, w2], [h1, h2]]):
-                    for side in l:
-                        line = VMobject()
-                        line.set_points_as_corners(side)
-                        dashedrectangle.add(
-                            DashedVMobject(
-                                line,
-                                num_dashes=n
-                                # positive_space_ratio=positive_space_ratio,
-                            )
-                        )
-                self.add(
-                    dashedrectangle[0],
-                    dashedrectangle[3],
-                    dashedrectangle[1],
-                    dashedrectangle[2],
-                )
+        title = Title(r"Partial sums of $\sum |s_i|^2$").to_edge(UP)
+
+        # the first million terms, summed in chunks and sampled for the plot
+        n = 10**6
+        at = sample_indices(n, 400)
+        s = Sequence(lambda i: 1 / i)
+        r = Sequence(lambda i: 1 / np.sqrt(i))
+        t = Sequence(lambda i: (-1) ** (i + 1) / i)
+        log_n = np.log10(at)
+
+        axes = Axes(
+            x_range=[0, 6, 1],
+            y_range=[0, 15, 5],
+            x_length=9,
+            y_length=4.5,
+            tips=False,
+        ).to_edge(DOWN)
+        x_label = MathTex(r"\log_{10} n", font_size=30).next_to(axes.x_axis, DOWN)
+        origin = axes.c2p(0, 0)
+        x_unit, y_unit = axes.c2p(1, 0) - origin, axes.c2p(0, 1) - origin
+
+        def plot_points(ys):
+            return origin + log_n[:, None] * x_unit + ys[:, None] * y_unit
+
+        limit = DashedLine(axes.c2p(0, PI**2 / 6), axes.c2p(6, PI**2 / 6), color=GREY)
+        limit_label = MathTex(r"\frac{\pi^2}{6}", font_size=30, color=GREY).next_to(
+            limit, RIGHT
+        )
+
+        # log10 of the number of terms summed so far
+        shown = ValueTracker(0)
+
+        def count():
+            return max(2, np.searchsorted(log_n, shown.get_value(), side="right"))
+
+        def partial_sum_curve(ys, color):
+            points = plot_points(ys)
+            curve = VMobject(color=color)
+            curve.add_updater(lambda c: c.set_points_as_corners(points[: count()]))
+            return curve.update()
+
+        converging = partial_sum_curve(norm_squared_sums(s, at), YELLOW)
+        diverging = partial_sum_curve(norm_squared_sums(r, at), RED)
+        converging_label = MathTex(
+            r"s_i = \frac{1}{i}", font_size=30, color=YELLOW
+        ).next_to(axes.c2p(6, PI**2 / 6), UP + LEFT)
+        diverging_label = MathTex(
+            r"s_i = \frac{1}{\sqrt{i}}", font_size=30, color=RED
+        ).next_to(axes.c2p(6, 14), LEFT)
+
+        inner = inner_product_sums(s, t, at)
+        terms = Integer(1).next_to(title, DOWN)
+        terms.add_updater(lambda m: m.set_value(at[count() - 1]))
+        terms_label = Tex(r"terms", font_size=35).next_to(terms, RIGHT)
+        terms_label.add_updater(lambda m: m.next_to(terms, RIGHT))
+        product = DecimalNumber(inner[0], num_decimal_places=6, font_size=35)
+        product.add_updater(lambda m: m.set_value(inner[count() - 1]))
+        product_label = MathTex(
+            r"\langle s, t \rangle \text{ with } t_i = \frac{(-1)^{i+1}}{i} \approx",
+            font_size=35,
+        ).next_to(terms, DOWN)
+        product.next_to(product_label, RIGHT)
+
+        self.play(Write(title))
+        self.play(Create(axes), Write(x_label))
+        self.play(Create(limit), Write(limit_label))
+        self.add(converging, diverging)
+        self.play(Write(terms), Write(terms_label))
+        self.play(Write(product_label), Write(product))
+        self.wait()
+        self.play(shown.animate.set_value(6), run_time=8, rate_func=linear)
+        self.play(Write(converging_label), Write(diverging_label))
+        self.wait(5)
+        self.clear_stage()
+
 
+class Theorem1Intro(DeckScene):
+    def construct(self):
         bigt = Tex("Hilbert Space Theorems")
 
         self.play(Write(bigt))
@@ -530,9 +695,9 @@ class Theorem1Intro(Scene):
         self.play(Write(thmtxt))
         self.play(Write(thmtxt2))
         self.wait(21)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
-        plane = NumberPlane()
+        plane = cached_plane()
 
         self.play(Create(plane))
         self.wait()
@@ -542,7 +707,8 @@ class Theorem1Intro(Scene):
             height=h, width=w, color=BLUE, fill_color=BLUE, fill_opacity=0.75
         ).align_to(plane.c2p(2, 0, 0), LEFT)
 
-        closest_r = Dot(plane.c2p(2, 0, 0), color=YELLOW)
+        box = convex.Box(rect.get_corner(DL), rect.get_corner(UR))
+        closest_r = Dot(box.project(plane.get_origin()), color=YELLOW)
         brace_r = BraceBetweenPoints(ORIGIN, closest_r.get_center())
 
         self.play(Create(rect))
@@ -554,7 +720,8 @@ class Theorem1Intro(Scene):
         circ = Circle(radius=r, color=RED, fill_color=RED, fill_opacity=0.75).move_to(
             plane.c2p(-2, 2)
         )
-        closest_c = Dot(plane.c2p(-1, 1, 0), color=YELLOW)
+        disk = convex.Disk(circ.get_center(), r)
+        closest_c = Dot(disk.project(plane.get_origin()), color=YELLOW)
         brace_c = BraceBetweenPoints(ORIGIN, closest_c.get_center())
 
         self.play(Create(circ))
@@ -598,10 +765,10 @@ class Theorem1Intro(Scene):
         self.play(FadeOut(nc), FadeOut(q))
         self.play(Create(q))
         self.wait(5)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
 
-class ParallelogramLawScene(Scene):
+class ParallelogramLawScene(DeckScene):
     def construct(self):
         title = Title("The parallelogram law").to_edge(UP).set_color(BLUE)
         self.play(Write(title))
@@ -682,10 +849,15 @@ class ParallelogramLawScene(Scene):
             )
         )
 
+        # lengths and turns to vertical of x, y, x+y, x-y
+        sides = np.array([a.end - a.start for a in (x, y, xpy, xmy)])
+        lengths = geometry.norms(sides) / scale_factor
+        turns = PI / 2 - geometry.angles(sides)
+
         # ------- create rectangle x --------
         nx = x.copy()
-        d = np.linalg.norm(x.start - x.end) / scale_factor
-        angle = PI / 2 - np.angle(complex(x.end[0] - x.start[0], x.end[1] - x.start[1]))
+        d = lengths[0]
+        angle = turns[0]
 
         nx1 = nx.copy().move_to((-d / 2, 0, 0))
         self.play(ReplacementTransform(nx, nx1))
@@ -705,11 +877,11 @@ class ParallelogramLawScene(Scene):
 
         # ------- create rectangle y --------
         ny = y.copy()
-        d = np.linalg.norm(y.start - y.end) / scale_factor
+        d = lengths[1]
 
         ny1 = ny.copy().move_to((-d / 2, 0, 0))
         self.play(ReplacementTransform(ny, ny1))
-        self.play(Rotate(ny1, PI / 2))
+        self.play(Rotate(ny1, turns[1]))
 
         ysq = (
             Square(side_length=d, fill_color=y.color, fill_opacity=0.5)
@@ -728,12 +900,10 @@ class ParallelogramLawScene(Scene):
 
         # ------- create rectangle x+y --------
         nxpy = xpy.copy()
-        d = np.linalg.norm(xpy.start - xpy.end) / scale_factor
+        d = lengths[2]
 
         nxpy1 = nxpy.copy().move_to((-d / 2, 0, 0))
-        angle = PI / 2 - np.angle(
-            complex(xpy.end[0] - xpy.start[0], xpy.end[1] - xpy.start[1])
-        )
+        angle = turns[2]
         self.play(ReplacementTransform(nxpy, nxpy1))
         self.play(Rotate(nxpy1, angle))
 
@@ -748,12 +918,10 @@ class ParallelogramLawScene(Scene):
 
         # ------- create rectangle x-y --------
         nxmy = xmy.copy()
-        d = np.linalg.norm(xmy.start - xmy.end) / scale_factor
+        d = lengths[3]
 
         nxmy1 = nxmy.copy().move_to((-d / 2, 0, 0))
-        angle = PI / 2 - np.angle(
-            complex(xmy.end[0] - xmy.start[0], xmy.end[1] - xmy.start[1])
-        )
+        angle = turns[3]
         self.play(ReplacementTransform(nxmy, nxmy1))
         self.play(Rotate(nxmy1, angle))
 
@@ -915,7 +1083,7 @@ class ParallelogramLawScene(Scene):
         self.wait(1)
 
 
-class ParallelogramLawTextScene(Scene):
+class ParallelogramLawTextScene(DeckScene):
     def construct(self):
         title = Title("The parallelogram law (with inner products)")
         title.to_edge(UP)
@@ -942,10 +1110,10 @@ class ParallelogramLawTextScene(Scene):
         self.play(Transform(fd1, fd1.copy().next_to(eq1, DOWN)))
         self.play(Transform(group, group.copy().move_to(ORIGIN)))
         self.wait(5)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
 
-class Theorem1Proof(Scene):
+class Theorem1Proof(DeckScene):
     def construct(self):
         title = Title("Hilbert Projection Theorem - Uniqueness")
         title.to_edge(UP)
@@ -1009,10 +1177,10 @@ class Theorem1Proof(Scene):
         self.wait(5)
         self.play(Write(l9))
         self.wait(29)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
 
-class Theorem2Intro(Scene):
+class Theorem2Intro(DeckScene):
     def construct(self):
         thm2 = Title("Orthogonal projections in Hilbert spaces", color=BLUE).to_edge(UP)
         self.play(Write(thm2))
@@ -1043,10 +1211,10 @@ class Theorem2Intro(Scene):
         self.wait(42)
         self.play(Write(l3))
         self.wait(5)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
 
-class Theorem2Proof1(Scene):
+class Theorem2Proof1(DeckScene):
     def construct(self):
         title = Title("Existence and uniqueness of the decomposition").to_edge(UP)
         self.play(Write(title))
@@ -1124,7 +1292,7 @@ class Theorem2Proof1(Scene):
         self.wait(5)
 
 
-class Theorem2Proof2(Scene):
+class Theorem2Proof2(DeckScene):
     def construct(self):
         title = Title(r"$P : H \to M$").to_edge(UP)
 
@@ -1142,7 +1310,7 @@ class Theorem2Proof2(Scene):
         self.wait(7)  # 7s
         self.play(Write(a1))
         self.wait(20 - 7)  # 20s
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
         title = Title(r"$Q : H \to M^\perp$").to_edge(UP)
         b1 = Tex("Let $z = Q(x)$.", font_size=35)
@@ -1203,10 +1371,10 @@ class Theorem2Proof2(Scene):
         self.wait(5)
         self.play(Write(c4))
         self.wait(14)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
 
-class Theorem2Proof25(Scene):
+class Theorem2Proof25(DeckScene):
     def construct(self):
         title = Title("P and Q are linear").to_edge(UP)
 
@@ -1259,10 +1427,10 @@ class Theorem2Proof25(Scene):
         self.wait(16)
         self.play(Write(b2), Write(b3))
         self.wait(9)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
 
-class Theorem2Proof3(Scene):
+class Theorem2Proof3(DeckScene):
     def construct(self):
         title = Title(
             r"$P(x)$ and $Q(x)$ minimize distance to $M$ and $M^\perp$"
@@ -1315,10 +1483,79 @@ class Theorem2Proof3(Scene):
             Transform(l, l2), Transform(a1, b1), Transform(a2, b2), Transform(a3, b3)
         )
         self.wait(24)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
+
+
+class OrthogonalDecompositionScene(DeckScene):
+    def construct(self):
+        title = Title(r"$x = P(x) + Q(x)$").to_edge(UP)
+        plane = cached_plane()
+
+        rng = np.random.default_rng(442)
+        cloud = rng.normal(scale=1.5, size=(2000, 3)) * [1, 1, 0]
+
+        # M is the line through the origin at this angle
+        angle = ValueTracker(PI / 6)
+        # how far the points have moved to their components
+        split = ValueTracker(0)
+
+        def direction():
+            return rotate_vector(RIGHT, angle.get_value())
+
+        decomposition = geometry.OrthogonalDecomposition([direction()])
+
+        m_line = Line(-8 * RIGHT, 8 * RIGHT, color=YELLOW)
+        m_line.add_updater(
+            lambda m: m.put_start_and_end_on(-8 * direction(), 8 * direction())
+        )
+        perp_line = Line(-8 * UP, 8 * UP, color=BLUE, stroke_opacity=0.6)
+        perp_line.add_updater(
+            lambda m: m.put_start_and_end_on(
+                -8 * rotate_vector(direction(), PI / 2),
+                8 * rotate_vector(direction(), PI / 2),
+            )
+        )
+
+        p_cloud = PMobject(stroke_width=3).add_points(cloud, color=YELLOW)
+        q_cloud = PMobject(stroke_width=3).add_points(cloud, color=BLUE)
+
+        def update_clouds(_):
+            # only refactors when M has turned since the last frame
+            decomposition.set_basis([direction()])
+            p, q = decomposition.split(cloud)
+            s = split.get_value()
+            p_cloud.points = cloud - s * q
+            q_cloud.points = cloud - s * p
+
+        p_cloud.add_updater(update_clouds)
+        p_cloud.update()
+
+        p_label = (
+            MathTex(r"P(x) \in M", color=YELLOW)
+            .to_corner(DL)
+            .add_background_rectangle()
+        )
+        q_label = (
+            MathTex(r"Q(x) \in M^\perp", color=BLUE)
+            .next_to(p_label, RIGHT, buff=LARGE_BUFF)
+            .add_background_rectangle()
+        )
+
+        self.play(Write(title), Create(plane))
+        self.play(Create(m_line), Create(perp_line))
+        self.play(FadeIn(q_cloud), FadeIn(p_cloud))
+        self.wait()
+        self.play(split.animate.set_value(1), run_time=3)
+        self.play(Write(p_label), Write(q_label))
+        self.wait(2)
+        self.play(angle.animate.increment_value(PI / 2), run_time=6, rate_func=linear)
+        self.wait(2)
+        self.play(split.animate.set_value(0), run_time=2)
+        self.wait()
+        self.clear_stage()
 
 
-class Outro(Scene):
+class Outro(DeckScene):
     def construct(self):
         text = Tex(
             r"""
@@ -1332,10 +1569,10 @@ class Outro(Scene):
         )
         self.play(Write(text))
         self.wait(32)
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.clear_stage()
 
 
-class Thumbnail(Scene):
+class Thumbnail(DeckScene):
     def construct(self):
         title = (
             Tex(r"Hilbert Spaces and Orthogonality")
@@ -0,0 +1,112 @@
+"""An append-only file of MPEG-TS segments, used instead of a directory of
+partial movies when DECK_SEGMENTS is set.
+
+A scene's animations are encoded one after the other onto the end of
+`<scene>.segments`, and `<scene>.segments.json` maps each cache key to the
+byte range of its segment. MPEG-TS needs no header or index of its own, so a
+segment is playable from any offset it starts at, and the scene movie is
+muxed from the ranges without copying them out to files.
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+
+class SegmentFile:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".json")
+        if self.index_path.exists():
+            self.index = json.loads(self.index_path.read_text())
+        else:
+            self.index = {}
+        self._file = None
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def start(self, command, **kwargs):
+        """Start the encoder command with its output appended to the file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._offset = self._file.seek(0, os.SEEK_END)
+        return subprocess.Popen(command, stdout=self._file, **kwargs)
+
+    def finish(self, key, process):
+        """Wait for the encoder started last and file its output under key."""
+        try:
+            if process.wait() != 0:
+                raise subprocess.CalledProcessError(process.returncode, process.args)
+            end = self._file.seek(0, os.SEEK_END)
+            self.index[key] = [self._offset, end - self._offset]
+        finally:
+            self._file.close()
+            self._file = None
+
+    def write(self, key, command, data):
+        """Append the output of command run on the input data."""
+        process = self.start(command, stdin=subprocess.PIPE)
+        process.stdin.write(data)
+        process.stdin.close()
+        self.finish(key, process)
+
+    def alias(self, key, existing):
+        self.index[key] = self.index[existing]
+
+    def save(self):
+        temporary = self.index_path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(self.index))
+        os.replace(temporary, self.index_path)
+
+    def concat_list(self, keys):
+        """Return an ffmpeg concat list reading the segments of keys in place."""
+        path = self.path.resolve()
+        lines = []
+        for key in keys:
+            offset, length = self.index[key]
+            source = f"subfile,,start,{offset},end,{offset + length},,:{path}"
+            lines.append(f"file '{source}'")
+        return "\n".join(lines) + "\n"
+
+    def concat(self, keys, output, ffmpeg="ffmpeg", loglevel="error"):
+        """Mux the segments of keys, in order, into output without re-encoding."""
+        command = [
+            ffmpeg,
+            "-y",
+            "-loglevel",
+            loglevel,
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-protocol_whitelist",
+            "pipe,file,subfile",
+            "-i",
+            "pipe:",
+            "-c",
+            "copy",
+            str(output),
+        ]
+        subprocess.run(command, input=self.concat_list(keys).encode(), check=True)
+
+    def compact(self, keep):
+        """Rewrite the file with only the segments of the keys in keep, dropping
+        the bytes of every other segment."""
+        ranges = {tuple(self.index[key]) for key in keep if key in self.index}
+        moved = {}
+        temporary = self.path.with_suffix(".tmp")
+        with open(self.path, "rb") as source, open(temporary, "wb") as target:
+            for offset, length in sorted(ranges):
+                moved[offset, length] = [target.tell(), length]
+                source.seek(offset)
+                target.write(source.read(length))
+        os.replace(temporary, self.path)
+        self.index = {
+            key: moved[tuple(self.index[key])] for key in keep if key in self.index
+        }
+        self.save()
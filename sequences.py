@@ -0,0 +1,54 @@
+"""Real sequences evaluated lazily, and their running sums.
+
+Terms are generated CHUNK at a time from a vectorized function of the index,
+so sums over millions of terms take constant memory and no Python loop per
+term. Only the partial sums at the requested indices are kept.
+"""
+
+import numpy as np
+
+CHUNK = 1 << 16
+
+
+class Sequence:
+    """The sequence s_1, s_2, ... whose terms term(i) computes for an array
+    of indices i."""
+
+    def __init__(self, term):
+        self.term = term
+
+    def chunks(self, n, size=CHUNK):
+        """Yield the terms s_1 ... s_n, size at a time."""
+        for start in range(1, n + 1, size):
+            yield self.term(np.arange(start, min(start + size, n + 1), dtype=float))
+
+
+def sample_indices(n, count):
+    """Return about count indices from 1 to n, spaced evenly on a log scale."""
+    return np.unique(np.geomspace(1, n, count).round().astype(np.int64))
+
+
+def running_sums(chunks, at):
+    """Return the partial sums of the summands yielded by chunks, up to each
+    index of the sorted array at (counting from 1)."""
+    at = np.asarray(at)
+    sums = np.empty(len(at))
+    total, offset, j = 0.0, 0, 0
+    for chunk in chunks:
+        cumulative = total + np.cumsum(chunk)
+        end = offset + len(chunk)
+        k = np.searchsorted(at, end, side="right")
+        sums[j:k] = cumulative[at[j:k] - offset - 1]
+        total, offset, j = cumulative[-1], end, k
+    return sums
+
+
+def norm_squared_sums(s, at):
+    """Return the partial sums of |s_i|^2 up to each index of at."""
+    return running_sums((np.abs(c) ** 2 for c in s.chunks(at[-1])), at)
+
+
+def inner_product_sums(s, t, at):
+    """Return the partial sums of s_i t_i up to each index of at."""
+    n = at[-1]
+    return running_sums((a * b for a, b in zip(s.chunks(n), t.chunks(n))), at)
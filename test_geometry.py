@@ -0,0 +1,17 @@
+import numpy as np
+
+from geometry import OrthogonalDecomposition
+
+
+def test_dependent_basis_vectors():
+    for basis in ([[1, 0, 0], [2, 0, 0], [0, 1, 0]], [[1, 1, 0], [2, 2, 0], [1, 0, 0]]):
+        decomposition = OrthogonalDecomposition(basis)
+        assert decomposition.q.shape == (3, 2)
+        p, q = decomposition.split([[0, 1, 0], [1, 2, 3]])
+        assert np.allclose(p, [[0, 1, 0], [1, 2, 0]])
+        assert np.allclose(q, [[0, 0, 0], [0, 0, 3]])
+
+
+def test_zero_basis():
+    p, q = OrthogonalDecomposition([[0, 0, 0]]).split([1, 2, 3])
+    assert np.allclose(p, 0) and np.allclose(q, [1, 2, 3])
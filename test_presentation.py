@@ -0,0 +1,15 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import tempconfig  # noqa: E402
+
+from presentation import DeckScene  # noqa: E402
+from rendering import DeckFileWriter, DeckRenderer  # noqa: E402
+
+
+def test_deck_renderer_installed(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path)}):
+        scene = DeckScene()
+    assert isinstance(scene.renderer, DeckRenderer)
+    assert isinstance(scene.renderer.file_writer, DeckFileWriter)
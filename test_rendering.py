@@ -0,0 +1,102 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+if shutil.which("ffmpeg") is None:
+    pytest.skip("ffmpeg is not installed", allow_module_level=True)
+
+from manim import RIGHT, Create, Square, tempconfig  # noqa: E402
+
+from presentation import DeckScene  # noqa: E402
+
+
+class Shapes(DeckScene):
+    batch_tex = False
+    wait_time = 2
+
+    def construct(self):
+        square = Square()
+        self.play(Create(square))
+        self.wait(self.wait_time)
+        self.play(square.animate.shift(RIGHT))
+
+
+def _render(scene_class, media_dir):
+    with tempconfig({"media_dir": str(media_dir), "quality": "low_quality"}):
+        scene = scene_class()
+        scene.render()
+        return scene.renderer.file_writer
+
+
+def _frames(movie):
+    output = subprocess.run(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-count_frames",
+            "-show_entries",
+            "stream=nb_read_frames",
+            "-of",
+            "csv=p=0",
+            str(movie),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(output.stdout)
+
+
+def test_stream(tmp_path, monkeypatch):
+    monkeypatch.setenv("DECK_STREAM", "1")
+    popen = subprocess.Popen
+    commands = []
+
+    def record(command, *args, **kwargs):
+        commands.append(command)
+        return popen(command, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", record)
+    movie = _render(Shapes, tmp_path).movie_file_path
+    monkeypatch.undo()
+    # one encoder for the whole scene, writing the movie itself
+    assert len(commands) == 1 and commands[0][-1] == str(movie)
+    assert _frames(movie) == 15 * 4
+
+
+def test_segments(tmp_path, monkeypatch):
+    monkeypatch.setenv("DECK_SEGMENTS", "1")
+    writer = _render(Shapes, tmp_path)
+    assert _frames(writer.movie_file_path) == 15 * 4
+    partial = Path(writer.partial_movie_directory)
+    assert (partial / "Shapes.segments").exists()
+    assert not list(partial.glob("*.mp4"))
+
+    # every animation is a cache hit, the movie is muxed from the index alone
+    size = (partial / "Shapes.segments").stat().st_size
+    Path(writer.movie_file_path).unlink()
+    writer = _render(Shapes, tmp_path)
+    assert _frames(writer.movie_file_path) == 15 * 4
+    assert (partial / "Shapes.segments").stat().st_size == size
+
+
+def test_retimed_wait(tmp_path, monkeypatch):
+    writer = _render(Shapes, tmp_path)
+    partial = Path(writer.partial_movie_directory)
+    before = {p: p.stat().st_mtime_ns for p in partial.glob("*.mp4")}
+
+    # only the wait changed: the plays are cache hits, the hold is new
+    monkeypatch.setattr(Shapes, "wait_time", 3)
+    writer = _render(Shapes, tmp_path)
+    assert _frames(writer.movie_file_path) == 15 * 5
+    holds = sorted(p.stem.rsplit("_", 1)[1] for p in partial.glob("hold_*"))
+    assert holds == ["30", "45"]
+    assert all(p.stat().st_mtime_ns == mtime for p, mtime in before.items())
+    # the new hold and the wait's partial movie linked to it
+    assert len(set(partial.glob("*.mp4")) - set(before)) == 2
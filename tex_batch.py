@@ -0,0 +1,153 @@
+"""Compile many Tex/MathTex fragments in a single LaTeX run.
+
+manim compiles every SingleStringMathTex on its own, which costs one latex and
+one dvisvgm process per fragment. compile_batch() typesets a list of fragments
+as the pages of one document, splits the pages with a single dvisvgm call and
+files every page in manim's tex cache under the name manim would have given
+it, so the mobjects built afterwards are all cache hits.
+"""
+
+import ast
+import inspect
+import os
+import re
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+from manim import SingleStringMathTex, config, logger
+from manim.utils.tex_file_writing import tex_compilation_command, tex_hash
+
+import deck
+
+# standalone crops the whole document to one page, so batches are typeset with
+# article (which standalone uses underneath, hence the same text width) and
+# dvisvgm crops each page to its ink instead
+BATCH_DOCUMENTCLASS = "\\documentclass{article}\n\\pagestyle{empty}"
+
+# only used to call SingleStringMathTex's string preprocessing
+_probe = SingleStringMathTex.__new__(SingleStringMathTex)
+
+
+def fragments(tex_class, tex_strings, **kwargs):
+    """Return the (expression, environment) pairs manim compiles to build
+    tex_class(*tex_strings, **kwargs): the joined string, then every part on
+    its own to split the submobjects."""
+    math = tex_class == "MathTex"
+    separator = kwargs.get("arg_separator", " " if math else "")
+    environment = kwargs.get("tex_environment", "align*" if math else "center")
+    parts = [s for s in tex_strings if s]
+    expressions = dict.fromkeys([separator.join(parts), *parts])
+    return [(_probe._get_modified_expression(e), environment) for e in expressions]
+
+
+def scene_fragments(scene_class):
+    """Collect the fragments of every literal Tex, MathTex and Title call in
+    scene_class.construct."""
+    source = textwrap.dedent(inspect.getsource(scene_class.construct))
+    found = {}
+    for tex_class, strings, kwargs in deck.tex_calls(ast.parse(source)):
+        found.update(dict.fromkeys(fragments(tex_class, strings, **kwargs)))
+    return list(found)
+
+
+def scene_template(scene_class):
+    # the Tex wrappers of the scene's module decide which template is used
+    module = sys.modules[scene_class.__module__]
+    return getattr(module, "template", config["tex_template"])
+
+
+def _cache_path(fragment, tex_template):
+    expression, environment = fragment
+    code = tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return Path(config.get_dir("tex_dir")) / tex_hash(code), code
+
+
+def missing(fragment_list, tex_template):
+    """Return the fragments that have no SVG in the tex cache yet."""
+    return [
+        f
+        for f in fragment_list
+        if not _cache_path(f, tex_template)[0].with_suffix(".svg").exists()
+    ]
+
+
+def compile_batch(fragment_list, tex_template):
+    """Typeset fragment_list as one multi-page document and file every page in
+    the tex cache. Returns False, leaving the fragments to manim, if the batch
+    does not compile."""
+    if not fragment_list:
+        return True
+    tex_dir = Path(config.get_dir("tex_dir"))
+    tex_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = [_cache_path(f, tex_template) for f in fragment_list]
+    prefix, suffix = tex_template.body.split(tex_template.placeholder_text)
+    pages = [code[len(prefix) : len(code) - len(suffix)] for _, code in entries]
+    document = (
+        prefix.replace(tex_template.documentclass, BATCH_DOCUMENTCLASS)
+        + "\n\\newpage\n".join(pages)
+        + suffix
+    )
+
+    batch = tex_dir / f"batch_{tex_hash(document)}.tex"
+    batch.write_text(document, encoding="utf-8")
+    output_format = tex_template.output_format
+    command = tex_compilation_command(
+        tex_template.tex_compiler, output_format, batch.as_posix(), tex_dir.as_posix()
+    )
+    dvi = batch.with_suffix(output_format)
+    if subprocess.run(command, shell=True).returncode != 0 or not dvi.exists():
+        logger.warning(f"Batch of {len(pages)} TeX fragments failed, see {batch}")
+        return False
+
+    for old in tex_dir.glob(f"{batch.stem}-*.svg"):
+        old.unlink()
+    converted = subprocess.run(
+        [
+            "dvisvgm",
+            *(["--pdf"] if output_format == ".pdf" else []),
+            "--page=1-",
+            "--bbox=min",
+            "--no-fonts",
+            "--verbosity=0",
+            f"--output={tex_dir / batch.stem}-%p.svg",
+            str(dvi),
+        ],
+    )
+    svgs = sorted(
+        tex_dir.glob(f"{batch.stem}-*.svg"),
+        key=lambda p: int(re.search(r"-(\d+)$", p.stem).group(1)),
+    )
+    if converted.returncode != 0:
+        # e.g. a parallel manim process cleaning the tex dir deleted the dvi
+        logger.warning(f"dvisvgm failed on {dvi}")
+        for svg in svgs:
+            svg.unlink()
+        return False
+    if len(svgs) != len(pages):
+        # a fragment spilled over a page, so the pages no longer line up
+        logger.warning(f"Batch {batch} produced {len(svgs)} pages for {len(pages)}")
+        for svg in svgs:
+            svg.unlink()
+        return False
+
+    for (base, code), svg in zip(entries, svgs):
+        tex_file = base.with_suffix(".tex")
+        if not tex_file.exists():
+            tex_file.write_text(code, encoding="utf-8")
+        os.replace(svg, base.with_suffix(".svg"))
+    # the batch's .tex, .dvi, .aux and .log; manim's cleanup keeps .tex files
+    for path in tex_dir.glob(f"{batch.stem}.*"):
+        path.unlink(missing_ok=True)
+    return True
+
+
+def compile_scene(scene_class):
+    """Batch compile the fragments of scene_class that are not cached yet."""
+    tex_template = scene_template(scene_class)
+    todo = missing(scene_fragments(scene_class), tex_template)
+    if todo:
+        logger.info(f"Compiling {len(todo)} TeX fragments in one batch")
+        compile_batch(todo, tex_template)